@@ -12,7 +12,7 @@ import time
 from typing import Optional, List
 
 from airport.runway import Runway, RunwayStatus
-from airport.scheduler import FlightScheduler, SlotInfo
+from airport.scheduler import FlightScheduler
 from airport.flight import Flight, FlightStatus
 
 
@@ -48,31 +48,57 @@ class Airport:
         self.airport_code = airport_code
         self.airport_name = airport_name
         self.runways: List[Runway] = []
+        # Availability as a bitmask (bit i = runways[i] is free), kept
+        # in sync via the runway status callback - lookup is a pair of
+        # integer ops regardless of runway count
+        self._avail_mask = 0
+        self._runway_index: dict = {}
         self.flight_scheduler = FlightScheduler()
     
     def add_runway(self, runway: Runway) -> None:
         """
         Add a runway to the airport.
         
+        Registers the airport as the runway's status observer so the
+        availability mask tracks assignments and releases automatically.
+        
         Args:
             runway: Runway instance to add to the airport.
         """
+        index = len(self.runways)
+        self._runway_index[runway.runway_id] = index
+        runway.on_status_change = self._runway_status_changed
         self.runways.append(runway)
+        if runway.status == RunwayStatus.AVAILABLE:
+            self._avail_mask |= 1 << index
+    
+    def _runway_status_changed(self, runway: Runway) -> None:
+        """
+        Keep the availability mask in sync with a runway's status.
+        
+        Called by Runway whenever its status changes: an available
+        runway sets its bit, an occupied or maintenance runway clears it.
+        """
+        bit = 1 << self._runway_index[runway.runway_id]
+        if runway.status == RunwayStatus.AVAILABLE:
+            self._avail_mask |= bit
+        else:
+            self._avail_mask &= ~bit
     
     def get_available_runway(self) -> Optional[Runway]:
         """
         Find and return an available runway for operations.
         
-        Iterates through all runways and returns the first one
-        with AVAILABLE status.
+        Isolates the lowest set bit of the availability mask - the
+        first free runway in insertion order - with two integer ops.
         
         Returns:
             An available Runway instance, or None if all runways are occupied.
         """
-        for runway in self.runways:
-            if runway.status == RunwayStatus.AVAILABLE:
-                return runway
-        return None
+        mask = self._avail_mask
+        if not mask:
+            return None
+        return self.runways[(mask & -mask).bit_length() - 1]
     
     def schedule_landing(self, flight: Flight, landing_time: int, duration: int) -> None:
         """
@@ -86,8 +112,7 @@ class Airport:
             landing_time: Unix timestamp for scheduled landing.
             duration: Duration in seconds for the landing operation.
         """
-        slot_info = SlotInfo(landing_time, landing_time + duration)
-        self.flight_scheduler.add_landing(flight, landing_time, slot_info)
+        self.flight_scheduler.add_landing(flight, landing_time, landing_time + duration)
     
     def schedule_takeoff(self, flight: Flight, takeoff_time: int, duration: int) -> None:
         """
@@ -101,8 +126,7 @@ class Airport:
             takeoff_time: Unix timestamp for scheduled takeoff.
             duration: Duration in seconds for the takeoff operation.
         """
-        slot_info = SlotInfo(takeoff_time, takeoff_time + duration)
-        self.flight_scheduler.add_takeoff(flight, takeoff_time, slot_info)
+        self.flight_scheduler.add_takeoff(flight, takeoff_time, takeoff_time + duration)
     
     def schedule_mayday(self, flight: Flight, duration: int) -> None:
         """
@@ -116,36 +140,37 @@ class Airport:
             duration: Duration in seconds for the emergency operation.
         """
         current_time = int(time.time())
-        slot_info = SlotInfo(current_time, current_time + duration)
-        self.flight_scheduler.add_mayday(flight, slot_info)
+        self.flight_scheduler.add_mayday(flight, current_time, current_time + duration)
     
     def process_next_flight(self) -> bool:
         """
         Process the next highest priority flight in the schedule.
         
-        Retrieves the next flight from the scheduler, finds an available
-        runway, and assigns the flight to it.
+        Peeks at the next flight in the scheduler, and only removes it
+        from the queue once a runway has been secured - if every runway
+        is busy the flight stays scheduled and is retried next call.
         
         Returns:
             True if flight was successfully assigned to a runway,
             False if no flights pending or no runway available.
         """
-        # Get next flight from priority queue
-        next_entry = self.flight_scheduler.get_next_flight()
+        # Peek at next flight in the priority queue
+        next_entry = self.flight_scheduler.peek_next_flight()
         if not next_entry:
             return False
         
-        # Find available runway
+        # Find available runway before committing the pop
         runway = self.get_available_runway()
         if not runway:
             print(f"[WARNING] No available runway for {next_entry.flight.flight_number}")
             return False
         
-        # Assign flight to runway
+        # Runway secured - now remove the entry and assign it
+        next_entry = self.flight_scheduler.get_next_flight()
         success = runway.assign_flight(
             next_entry.flight,
-            next_entry.slot_info.start_time,
-            next_entry.slot_info.end_time
+            next_entry.start_time,
+            next_entry.end_time
         )
         
         if success:
@@ -195,5 +220,11 @@ if __name__ == "__main__":
     # Process all flights in priority order
     print("Processing flights in priority order:")
     print("-" * 50)
-    while airport.flight_scheduler.get_schedule_size() > 0:
-        airport.process_next_flight()
+    for entry in airport.flight_scheduler.drain():
+        runway = airport.get_available_runway()
+        if runway:
+            runway.assign_flight(entry.flight, entry.start_time, entry.end_time)
+            print(f"[INFO] Assigned {entry.flight.flight_number} "
+                  f"to {runway.runway_id} for {entry.used_for.value}")
+        else:
+            print(f"[WARNING] No available runway for {entry.flight.flight_number}")
@@ -67,6 +67,12 @@ class Runway:
         self.runway_name = runway_name
         self.direction = direction
         
+        # Invariant part of get_runway_details, built once - only the
+        # status/slot suffix changes between calls
+        self._details_prefix = (
+            f"Runway {runway_name} with heading {direction}. "
+        )
+        
         # Operational state
         self.status = RunwayStatus.AVAILABLE
         self.current_flight: Optional[Flight] = None
@@ -74,6 +80,15 @@ class Runway:
         # Time slot tracking
         self.operation_start_time: Optional[int] = None
         self.operation_end_time: Optional[int] = None
+        
+        # Status observer (set by Airport.add_runway) - notified whenever
+        # the runway changes status so the airport's free list stays current
+        self.on_status_change = None
+    
+    def _notify_status_change(self) -> None:
+        """Notify the registered observer (if any) of a status change."""
+        if self.on_status_change:
+            self.on_status_change(self)
     
     def get_runway_details(self) -> str:
         """
@@ -90,11 +105,8 @@ class Runway:
         if self.operation_end_time and self.operation_end_time <= time.time():
             self.complete_landing_or_takeoff()
         
-        # Build details string
-        details = (
-            f"Runway {self.runway_name} with heading {self.direction}. "
-            f"Current status: {self.status.value}."
-        )
+        # Build details string (static prefix precomputed at init)
+        details = self._details_prefix + f"Current status: {self.status.value}."
         
         # Add slot end time if runway is occupied
         if self.operation_end_time:
@@ -129,6 +141,7 @@ class Runway:
         self.current_flight = flight
         self.operation_start_time = start_time
         self.operation_end_time = end_time
+        self._notify_status_change()
         
         return True
     
@@ -152,6 +165,7 @@ class Runway:
         self.current_flight = None
         self.operation_start_time = None
         self.operation_end_time = None
+        self._notify_status_change()
     
     def set_maintenance(self) -> None:
         """
@@ -161,6 +175,7 @@ class Runway:
         due to maintenance activities.
         """
         self.status = RunwayStatus.MAINTENANCE
+        self._notify_status_change()
     
     def __repr__(self) -> str:
         """Return string representation of the runway."""
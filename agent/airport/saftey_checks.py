@@ -14,7 +14,18 @@ Standard separation minimums used:
 """
 
 import math
-from typing import Dict, Tuple
+from dataclasses import dataclass
+from math import cos, hypot, pi, sin, sqrt
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Optional JIT: numba compiles the scalar CPA kernel and heading/vector
+# helpers to machine code; without it everything still runs as plain Python.
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is in requirements
+    njit = None
 
 # =============================================================================
 # Constants
@@ -23,6 +34,19 @@ from typing import Dict, Tuple
 # Conversion factor: 1 knot = 1 NM/hour = 1/60 NM/minute
 KNOT_TO_NM_PER_MIN = 1 / 60.0
 
+# Degrees-to-radians factor, bound once so the hot trig paths multiply
+# instead of calling math.radians through a module attribute lookup
+_DEG2RAD = pi / 180.0
+
+# A flight blocks the runway when it's short final / rolling out, or
+# actively landing or taking off. Frozensets: hashed once, O(1) membership.
+_RUNWAY_BLOCKING_LAST = frozenset(("FINAL", "RUNWAY"))
+_RUNWAY_BLOCKING_STATUS = frozenset(("taking_off", "landing"))
+
+# The mandatory landing pattern checkpoints. Membership tests only - use
+# a frozenset; the pattern's order is enforced by the prompt, not here.
+LANDING_PATTERN_WAYPOINTS = frozenset(("DOWNWIND", "BASE", "FINAL", "RUNWAY"))
+
 
 # =============================================================================
 # Utility Functions
@@ -52,9 +76,9 @@ def heading_to_vector(heading_deg: float) -> Tuple[float, float]:
         >>> heading_to_vector(90)   # East
         (1.0, 0.0)
     """
-    radians = math.radians(heading_deg)
-    dx = math.sin(radians)  # East-West component
-    dy = math.cos(radians)  # North-South component
+    radians = heading_deg * _DEG2RAD
+    dx = sin(radians)  # East-West component
+    dy = cos(radians)  # North-South component
     return dx, dy
 
 
@@ -101,10 +125,131 @@ def state_after_time(flight: Dict, time_minutes: float) -> Tuple[float, float, f
     return x, y, altitude
 
 
+# =============================================================================
+# Traffic Batch (structure-of-arrays)
+# =============================================================================
+
+@dataclass
+class FlightBatch:
+    """
+    Structure-of-arrays view over a traffic list.
+
+    Each numeric field lives in one contiguous, dtype-packed array instead
+    of being scattered across per-flight dicts, so the safety checks below
+    reduce to array expressions with no per-flight Python lookups. Built
+    once per command (FlightBatch.from_dicts) and shared by every check;
+    the source dicts are kept so callers can report on a flagged flight.
+    """
+    x: np.ndarray          # East-West position, NM (float32)
+    y: np.ndarray          # North-South position, NM (float32)
+    alt: np.ndarray        # Altitude, ft (float32)
+    speed: np.ndarray      # Ground speed, knots (float32)
+    heading: np.ndarray    # Heading, degrees (float32)
+    status: np.ndarray     # Flight status strings (object)
+    last_waypoint: np.ndarray  # Last passed waypoint or "" (object)
+    callsign: np.ndarray   # Callsigns (object)
+    flights: List[Dict]    # Source dicts, aligned with the arrays
+
+    @classmethod
+    def from_dicts(cls, flights: List[Dict]) -> "FlightBatch":
+        """
+        Pack a list of flight dicts into aligned arrays.
+
+        Missing kinematics default to zero - traffic still on the ground
+        (or otherwise without a position) only matters to the status/
+        waypoint masks, never the CPA math.
+        """
+        n = len(flights)
+        positions = [f.get("position") or {"x": 0.0, "y": 0.0} for f in flights]
+        return cls(
+            x=np.fromiter((p["x"] for p in positions), dtype=np.float32, count=n),
+            y=np.fromiter((p["y"] for p in positions), dtype=np.float32, count=n),
+            alt=np.fromiter((f.get("altitude") or 0.0 for f in flights),
+                            dtype=np.float32, count=n),
+            speed=np.fromiter((f.get("speed") or 0.0 for f in flights),
+                              dtype=np.float32, count=n),
+            heading=np.fromiter((f.get("heading") or 0.0 for f in flights),
+                                dtype=np.float32, count=n),
+            status=np.array([f.get("status", "") for f in flights], dtype=object),
+            last_waypoint=np.array([last_waypoint(f) for f in flights], dtype=object),
+            callsign=np.array([f.get("callsign", "") for f in flights], dtype=object),
+            flights=flights,
+        )
+
+    def __len__(self) -> int:
+        return self.x.shape[0]
+
+
 # =============================================================================
 # Conflict Detection
 # =============================================================================
 
+def _cpa_kernel(x1, y1, a1, spd1, hdg1,
+                x2, y2, a2, spd2, hdg2,
+                horizon_min, horizontal_threshold_nm, vertical_threshold_ft):
+    """
+    Numeric core of the closest-point-of-approach check.
+
+    Pure scalar math so numba can compile it; dict unpacking and result
+    shaping stay in the predict_conflict wrapper.
+
+    Returns:
+        Tuple (will_conflict, time_min, min_horizontal_nm, vertical_ft)
+        where time_min is the conflict entry time on conflict, otherwise
+        the time of closest approach.
+    """
+    dx1, dy1 = heading_to_vector(hdg1)
+    dx2, dy2 = heading_to_vector(hdg2)
+    v1 = spd1 * KNOT_TO_NM_PER_MIN
+    v2 = spd2 * KNOT_TO_NM_PER_MIN
+
+    dpx = x1 - x2
+    dpy = y1 - y2
+    dvx = dx1 * v1 - dx2 * v2
+    dvy = dy1 * v1 - dy2 * v2
+
+    dp2 = dpx * dpx + dpy * dpy
+    dv2 = dvx * dvx + dvy * dvy
+    dot = dpx * dvx + dpy * dvy
+
+    # Vertical separation is constant in this model (no climbs/descents)
+    vertical_sep = abs(a1 - a2)
+
+    # Closest point of approach, clamped to the look-ahead window.
+    # dv2 == 0 means identical velocities: separation never changes.
+    if dv2 == 0.0:
+        time_of_cpa = 0.0
+    else:
+        time_of_cpa = min(max(-dot / dv2, 0.0), horizon_min)
+
+    min_horizontal_sep = hypot(dpx + dvx * time_of_cpa,
+                               dpy + dvy * time_of_cpa)
+
+    if min_horizontal_sep <= horizontal_threshold_nm and vertical_sep < vertical_threshold_ft:
+        # First moment the pair enters the separation circle: the smaller
+        # root of |dp + dv*t|^2 = threshold^2 (0 if already inside it)
+        threshold_sq = horizontal_threshold_nm * horizontal_threshold_nm
+        if dp2 <= threshold_sq:
+            time_of_conflict = 0.0
+        else:
+            discriminant = dot * dot - dv2 * (dp2 - threshold_sq)
+            time_of_conflict = max(0.0, (-dot - sqrt(discriminant)) / dv2)
+        return True, time_of_conflict, min_horizontal_sep, vertical_sep
+
+    return False, time_of_cpa, min_horizontal_sep, vertical_sep
+
+
+if njit is not None:
+    heading_to_vector = njit(cache=True, fastmath=True)(heading_to_vector)
+    _cpa_kernel = njit(cache=True, fastmath=True)(_cpa_kernel)
+    # Warm the JIT at import (cache=True makes later processes load the
+    # compiled kernel from disk) so the first live command pays no
+    # compile latency
+    _cpa_kernel(0.0, 0.0, 0.0, 250.0, 90.0,
+                10.0, 10.0, 1000.0, 250.0, 270.0,
+                2.0, 5.0, 1000.0)
+
+
 def predict_conflict(
     flight_1: Dict,
     flight_2: Dict,
@@ -129,8 +274,9 @@ def predict_conflict(
         horizon_min: Look-ahead time horizon in minutes (default: 1.0).
         horizontal_threshold_nm: Minimum horizontal separation in NM (default: 5.0).
         vertical_threshold_ft: Minimum vertical separation in feet (default: 1000.0).
-        time_step: Simulation time step in minutes (default: 0.1).
-    
+        time_step: Unused; kept for call-site compatibility with the old
+            time-stepped implementation.
+
     Returns:
         Dictionary containing:
         - will_conflict (bool): True if separation loss predicted
@@ -138,57 +284,163 @@ def predict_conflict(
         - time_of_closest_approach_min (float): Time of closest approach (if no conflict)
         - min_horizontal_nm (float): Minimum horizontal separation found
         - min_vertical_ft (float): Vertical separation at closest approach
-    
+
     Example:
         >>> result = predict_conflict(flight_a, flight_b, horizon_min=2.0)
         >>> if result['will_conflict']:
         ...     print(f"Conflict in {result['time_of_conflict_min']:.1f} minutes")
+
+    Note:
+        Under the constant-velocity model the separation over time is a
+        parabola in t, so the closest point of approach comes straight out
+        of the relative position/velocity vectors - no time stepping:
+        t_cpa = -(dp . dv) / |dv|^2, clamped to [0, horizon].
     """
-    # Track minimum separation found during simulation
-    min_horizontal_sep = float("inf")
-    min_vertical_sep = float("inf")
-    time_of_minimum = 0.0
-    
-    # Simulate forward in time
-    current_time = 0.0
-    while current_time <= horizon_min:
-        # Get predicted positions for both aircraft
-        x1, y1, alt1 = state_after_time(flight_1, current_time)
-        x2, y2, alt2 = state_after_time(flight_2, current_time)
-        
-        # Calculate separations
-        horizontal_sep = math.hypot(x1 - x2, y1 - y2)
-        vertical_sep = abs(alt1 - alt2)
-        
-        # Update minimum if this is the closest approach so far
-        if horizontal_sep < min_horizontal_sep:
-            min_horizontal_sep = horizontal_sep
-            min_vertical_sep = vertical_sep
-            time_of_minimum = current_time
-        
-        # Check for immediate separation violation
-        is_horizontal_violation = horizontal_sep <= horizontal_threshold_nm
-        is_vertical_violation = vertical_sep < vertical_threshold_ft
-        
-        if is_horizontal_violation and is_vertical_violation:
-            return {
-                "will_conflict": True,
-                "time_of_conflict_min": current_time,
-                "min_horizontal_nm": min_horizontal_sep,
-                "min_vertical_ft": min_vertical_sep,
-            }
-        
-        current_time += time_step
-    
+    pos_1 = flight_1["position"]
+    pos_2 = flight_2["position"]
+    will_conflict, time_min, min_horizontal_sep, vertical_sep = _cpa_kernel(
+        float(pos_1["x"]), float(pos_1["y"]), float(flight_1["altitude"]),
+        float(flight_1["speed"]), float(flight_1["heading"]),
+        float(pos_2["x"]), float(pos_2["y"]), float(flight_2["altitude"]),
+        float(flight_2["speed"]), float(flight_2["heading"]),
+        horizon_min, horizontal_threshold_nm, vertical_threshold_ft,
+    )
+
+    if will_conflict:
+        return {
+            "will_conflict": True,
+            "time_of_conflict_min": time_min,
+            "min_horizontal_nm": min_horizontal_sep,
+            "min_vertical_ft": vertical_sep,
+        }
+
     # No conflict found within horizon
     return {
         "will_conflict": False,
-        "time_of_closest_approach_min": time_of_minimum,
+        "time_of_closest_approach_min": time_min,
         "min_horizontal_nm": min_horizontal_sep,
-        "min_vertical_ft": min_vertical_sep,
+        "min_vertical_ft": vertical_sep,
     }
 
 
+def last_waypoint(flight: Dict) -> str:
+    """
+    Last waypoint the flight passed, or "" if it hasn't passed any.
+
+    One place for the get/index/truthiness dance that every traffic scan
+    repeats per flight.
+    """
+    passed = flight.get("passed_waypoints")
+    return passed[-1] if passed else ""
+
+
+def find_runway_conflict(traffic: FlightBatch) -> Optional[Dict]:
+    """
+    Find traffic that makes a runway clearance unsafe.
+
+    The landing and takeoff clearance checks apply the identical rule -
+    nobody may be cleared while another aircraft is on FINAL or the
+    RUNWAY, or mid landing/takeoff - so both share this one predicate,
+    evaluated as a single mask over the batch arrays.
+
+    Args:
+        traffic: Batched traffic to screen.
+
+    Returns:
+        The first blocking flight's dict, or None when the runway is clear.
+    """
+    if len(traffic) == 0:
+        return None
+    blocking = (np.isin(traffic.last_waypoint, tuple(_RUNWAY_BLOCKING_LAST))
+                | np.isin(traffic.status, tuple(_RUNWAY_BLOCKING_STATUS)))
+    if not blocking.any():
+        return None
+    return traffic.flights[int(np.argmax(blocking))]
+
+
+def check_enroute_conflicts(
+    current_flight: Dict,
+    traffic: FlightBatch,
+    horizon_min: float = 1.0,
+    horizontal_threshold_nm: float = 5.0,
+    vertical_threshold_ft: float = 1000.0,
+) -> Optional[int]:
+    """
+    Run the closest-point-of-approach check against every candidate flight
+    in one vectorized pass.
+
+    Same math as predict_conflict, but computed over N-wide batch arrays
+    instead of one Python call (with its own trig and dict unpacking) per
+    flight. Landing traffic (in the pattern or actively landing) is masked
+    out here, so callers pass the whole batch.
+
+    Args:
+        current_flight: Aircraft being commanded.
+        traffic: Batched traffic to screen.
+        horizon_min: Look-ahead time horizon in minutes.
+        horizontal_threshold_nm: Minimum horizontal separation in NM.
+        vertical_threshold_ft: Minimum vertical separation in feet.
+
+    Returns:
+        Index into the batch of the first conflicting flight, or None
+        when every pair stays separated inside the horizon.
+    """
+    if len(traffic) == 0:
+        return None
+
+    # En-route separation doesn't apply to flights working the landing
+    # pattern - they fly the published checkpoints, not random headings
+    eligible = (np.isin(traffic.status, ("landing", "on_final"), invert=True)
+                & np.isin(traffic.last_waypoint, tuple(LANDING_PATTERN_WAYPOINTS),
+                          invert=True))
+
+    dpx = current_flight["position"]["x"] - traffic.x.astype(np.float64)
+    dpy = current_flight["position"]["y"] - traffic.y.astype(np.float64)
+    spd2 = traffic.speed.astype(np.float64)
+
+    # Spatial pre-filter: even flying head-on, a pair can close at most
+    # horizon * (spd1 + spd2) NM inside the window, so anything starting
+    # further apart than that plus the threshold can never conflict.
+    # Compared squared to skip the sqrt; the trig and CPA math below only
+    # run on the flights that survive.
+    max_closure_nm = (horizon_min * (current_flight["speed"] + spd2) * KNOT_TO_NM_PER_MIN
+                      + horizontal_threshold_nm)
+    near = eligible & (dpx * dpx + dpy * dpy <= max_closure_nm * max_closure_nm)
+    if not near.any():
+        return None
+
+    near_idx = np.nonzero(near)[0]
+    dpx, dpy = dpx[near], dpy[near]
+    a2 = traffic.alt.astype(np.float64)[near]
+    spd2 = spd2[near]
+    hdg2 = traffic.heading.astype(np.float64)[near]
+
+    rad2 = np.radians(hdg2)
+    vx2 = np.sin(rad2) * spd2 * KNOT_TO_NM_PER_MIN
+    vy2 = np.cos(rad2) * spd2 * KNOT_TO_NM_PER_MIN
+
+    dx1, dy1 = heading_to_vector(current_flight["heading"])
+    v1 = current_flight["speed"] * KNOT_TO_NM_PER_MIN
+
+    dvx = dx1 * v1 - vx2
+    dvy = dy1 * v1 - vy2
+
+    dv2 = dvx * dvx + dvy * dvy
+    # where() keeps the zero-relative-velocity pairs out of the division;
+    # their t_cpa clamps to 0, matching the scalar path
+    t_cpa = np.clip(-(dpx * dvx + dpy * dvy) / np.where(dv2 > 0, dv2, 1.0),
+                    0.0, horizon_min)
+    sep = np.hypot(dpx + dvx * t_cpa, dpy + dvy * t_cpa)
+    vsep = np.abs(current_flight["altitude"] - a2)
+
+    conflict = (sep <= horizontal_threshold_nm) & (vsep < vertical_threshold_ft)
+    if not conflict.any():
+        return None
+    # near_idx is ascending, so the first conflict in the filtered view is
+    # also the first in batch order
+    return int(near_idx[np.argmax(conflict)])
+
+
 # =============================================================================
 # Example Usage / Module Testing
 # =============================================================================
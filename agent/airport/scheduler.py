@@ -1,11 +1,19 @@
 from airport.flight import Flight, FlightStatus
-from typing import List, Optional
-import heapq
+from typing import NamedTuple, Optional
 import time
 
+import numpy as np
+from sortedcontainers import SortedList
+
 
 class SlotInfo:
-    """Contains time slot information for a flight operation"""
+    """Deprecated: slot times now live inline on ScheduleEntry.
+
+    Kept only so external code that still builds SlotInfo objects keeps
+    importing; the scheduler itself no longer stores them.
+    """
+    __slots__ = ('start_time', 'end_time')
+    
     def __init__(self, start_time: int, end_time: int):
         self.start_time = start_time
         self.end_time = end_time
@@ -13,45 +21,62 @@ class SlotInfo:
     def __repr__(self):
         return f"SlotInfo({self.start_time}-{self.end_time})"
 
-class ScheduleEntry:
-    """Entry in the flight scheduler heap"""
-    def __init__(self, value: int, flight: Flight, slot_info: SlotInfo, used_for: FlightStatus):
-        self.value = value
-        self.flight = flight
-        self.slot_info = slot_info
-        self.used_for = used_for
-    
-    def __lt__(self, other):
-        """For heap comparison - lower value has higher priority"""
-        return self.value < other.value
+class ScheduleEntry(NamedTuple):
+    """Entry in the flight scheduler heap.
+
+    As a NamedTuple, heap comparisons are native C tuple compares on
+    (value, seq) - no Python-level __lt__ dispatch per sift. The seq
+    counter keeps ordering FIFO within equal priorities and stops the
+    compare from ever reaching the non-orderable Flight field. Slot
+    start/end times are inlined as plain ints, so scans over the heap
+    read them without chasing a per-entry SlotInfo pointer.
+    """
+    value: int
+    seq: int
+    flight: Flight
+    start_time: int
+    end_time: int
+    used_for: FlightStatus
     
     def __repr__(self):
         return f"ScheduleEntry(value={self.value}, flight={self.flight.flight_number}, used_for={self.used_for.value})"
 
 class FlightScheduler:
-    """Manages flight schedules using a min-heap priority queue"""
+    """Manages flight schedules using a sorted priority queue.
+
+    SortedList keeps entries fully ordered by (value, seq) with its
+    optimized bisect-based inserts, so peek/pop are simple index
+    operations and iterating the schedule visits entries in priority
+    order directly.
+    """
     def __init__(self):
-        self.schedule_heap: List[ScheduleEntry] = []
+        self.schedule_heap: SortedList = SortedList()
+        self._counter = 0
+    
+    def _push(self, value: int, flight: Flight, start_time: int, end_time: int,
+              used_for: FlightStatus):
+        """Push an entry, tagging it with the FIFO tiebreaker counter"""
+        self.schedule_heap.add(
+            ScheduleEntry(value, self._counter, flight, start_time, end_time, used_for)
+        )
+        self._counter += 1
     
-    def add_landing(self, flight: Flight, landing_time: int, slot_info: SlotInfo):
+    def add_landing(self, flight: Flight, landing_time: int, end_time: int):
         """Add a landing flight to schedule (priority = landing_time)"""
-        entry = ScheduleEntry(landing_time, flight, slot_info, FlightStatus.LANDING)
-        heapq.heappush(self.schedule_heap, entry)
+        self._push(landing_time, flight, landing_time, end_time, FlightStatus.LANDING)
     
-    def add_takeoff(self, flight: Flight, scheduled_time: int, slot_info: SlotInfo):
+    def add_takeoff(self, flight: Flight, scheduled_time: int, end_time: int):
         """Add a takeoff flight to schedule (priority = scheduled_time)"""
-        entry = ScheduleEntry(scheduled_time, flight, slot_info, FlightStatus.TAKEOFF)
-        heapq.heappush(self.schedule_heap, entry)
+        self._push(scheduled_time, flight, scheduled_time, end_time, FlightStatus.TAKEOFF)
     
-    def add_mayday(self, flight: Flight, slot_info: SlotInfo):
+    def add_mayday(self, flight: Flight, start_time: int, end_time: int):
         """Add a mayday/emergency flight (priority = -1, highest priority)"""
-        entry = ScheduleEntry(-1, flight, slot_info, FlightStatus.MAYDAY)
-        heapq.heappush(self.schedule_heap, entry)
+        self._push(-1, flight, start_time, end_time, FlightStatus.MAYDAY)
     
     def get_next_flight(self) -> Optional[ScheduleEntry]:
         """Get the highest priority flight from schedule"""
         if self.schedule_heap:
-            return heapq.heappop(self.schedule_heap)
+            return self.schedule_heap.pop(0)
         return None
     
     def peek_next_flight(self) -> Optional[ScheduleEntry]:
@@ -64,24 +89,59 @@ class FlightScheduler:
         """Get the number of flights in schedule"""
         return len(self.schedule_heap)
     
+    def drain(self):
+        """Yield schedule entries in priority order until the heap is empty.
+        
+        Lets callers loop the schedule directly instead of re-checking
+        get_schedule_size() and re-dispatching per iteration.
+        """
+        while self.schedule_heap:
+            yield self.schedule_heap.pop(0)
+    
     def delay_flights(self, delay_in_mins):
+        """Push back every flight whose slot starts before the delay cutoff.
+
+        Affected flights are re-slotted sequentially after the cutoff,
+        each keeping its original slot duration; later flights are left
+        alone. The chained start times are computed as one vectorized
+        cumulative sum over the inlined slot fields, and the schedule is
+        rebuilt in one bulk SortedList construction instead of
+        per-entry removes and re-inserts.
+        """
         # new start time after applying delay
-        delay = time.time() + delay_in_mins    # int
+        delay = time.time() + delay_in_mins * 60
+
+        # The schedule is ordered by priority, not start time, so
+        # partition on a vectorized start-time gather
+        starts = np.fromiter((e.start_time for e in self.schedule_heap),
+                             dtype=np.float64, count=len(self.schedule_heap))
+        if not np.any(starts <= delay):
+            return
+        # Iteration order is priority order, so affected comes out
+        # already sorted for the chained re-slotting below
+        affected = [e for e, s in zip(self.schedule_heap, starts) if s <= delay]
+        unaffected = [e for e, s in zip(self.schedule_heap, starts) if s > delay]
+        # Chained re-slotting in closed form: each flight starts 2s
+        # after the previous one ends, so start_i is the cutoff plus
+        # the cumulative duration of the flights re-slotted before it
+        durations = np.fromiter(
+            (e.end_time - e.start_time for e in affected),
+            dtype=np.float64, count=len(affected))
+        new_starts = delay + 2 * np.arange(1, len(affected) + 1) \
+            + np.concatenate(([0.0], np.cumsum(durations[:-1])))
+        new_ends = new_starts + durations
 
-        for flight in self.schedule_heap:
-            start, end = flight.slot_info
-            if start > delay:
-                break
+        for i, entry in enumerate(affected):
+            # Mayday entries keep their -1 priority; everything else is
+            # re-prioritized on its new start time
+            affected[i] = entry._replace(
+                value=entry.value if entry.used_for == FlightStatus.MAYDAY
+                else new_starts[i],
+                start_time=new_starts[i],
+                end_time=new_ends[i],
+            )
 
-            interval = end - start
-            new_start = delay + 2
-            new_end = new_start + interval
-            # update the slot_info
-            flight.slot_info[0] = new_start
-            flight.slot_info[1] = new_end
-            # next delay is this flight’s end
-            delay = new_end
-        return
+        self.schedule_heap = SortedList(unaffected + affected)
 
 
     def __repr__(self):
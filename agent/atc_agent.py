@@ -11,12 +11,17 @@ The agent handles:
 """
 
 import os
+import asyncio
 import json
 import re
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import TypedDict, Literal
 
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
 import google.generativeai as genai
 from langgraph.graph import StateGraph, END
 
@@ -26,11 +31,32 @@ from airport.runway import Runway
 from airport.flight import Flight
 from database.atc_db import ATCDatabase
 from utils.llm import LLM
-from prompts.landing_prompt import LANDING_PROMPT
+from prompts.landing_prompt import render_landing_prompt
 from prompts.take_off_prompt import TAKE_OFF_PROMPT
+from prompts.batch_prompt import BATCH_PROMPT
 from config import API_BASE_URL
 
 
+# Shared HTTP session: keep-alive connections to the simulator API are
+# pooled and reused, so each fetch skips the TCP handshake that a bare
+# requests.get() pays per call
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=8, pool_maxsize=32))
+_SESSION.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=32))
+
+# Extracts the ```json ... ``` block from an LLM response - compiled
+# once instead of hitting the re module cache per parse
+_JSON_BLOCK_RE = re.compile(r"```json(.*?)```", re.DOTALL)
+
+# Worker pool for the independent context fetches - shared between agent
+# instances (one is created per flight) so threads are not spawned per run
+_IO_POOL = ThreadPoolExecutor(max_workers=4)
+
+# Upper bound on flights folded into one batched LLM call - keeps the
+# combined prompt comfortably inside the model's context window
+MAX_BATCH_SIZE = 8
+
+
 # ============================================================================
 # State Definition
 # ============================================================================
@@ -104,6 +130,13 @@ class ATCAgent:
         print(f"[INIT] Building LangGraph workflow...")
         self.workflow = self._build_workflow()
         
+        # Context cache: retries of a node reuse weather/traffic/rules
+        # fetched moments earlier instead of re-issuing the HTTP calls
+        self._ctx_cache: dict = {}
+        
+        # Serialized-prompt-fragment cache (see _dumps_cached)
+        self._dumps_cache: dict = {}
+        
         # Initialize state
         self.state = {
             "messages": [],
@@ -168,15 +201,95 @@ class ATCAgent:
     # API Helper Methods
     # ========================================================================
     
-    def _get_runway_status(self) -> list:
+    def _get_ctx(self, key: str, fetcher, ttl: float = 2.0):
+        """
+        Fetch a piece of LLM context through a short-lived cache.
+        
+        Safety-check retries re-enter the landing/takeoff nodes within
+        milliseconds; within the TTL they reuse the context already
+        fetched instead of repeating every HTTP round-trip.
+        
+        Args:
+            key: Cache key identifying the context item
+            fetcher: Zero-argument callable producing the value on a miss
+            ttl: Maximum age in seconds before the entry is refetched
+            
+        Returns:
+            The cached or freshly fetched value
+        """
+        cached = self._ctx_cache.get(key)
+        now = time.time()
+        if cached is not None and now - cached[1] < ttl:
+            return cached[0]
+        value = fetcher()
+        self._ctx_cache[key] = (value, now)
+        return value
+    
+    def _gather_ctx(self, items, ttl: float = 2.0) -> list:
+        """
+        Resolve several context items concurrently.
+        
+        Cache misses are dispatched to the shared worker pool so the
+        independent HTTP fetches overlap - wall-clock cost becomes the
+        slowest fetch rather than the sum of all of them. Hits are
+        served straight from the TTL cache like _get_ctx.
+        
+        Args:
+            items: Sequence of (key, fetcher) pairs
+            ttl: Maximum age in seconds before an entry is refetched
+            
+        Returns:
+            List of values in the same order as the requested keys
+        """
+        now = time.time()
+        pending = {}
+        for key, fetcher in items:
+            cached = self._ctx_cache.get(key)
+            if cached is None or now - cached[1] >= ttl:
+                pending[key] = _IO_POOL.submit(fetcher)
+        for key, future in pending.items():
+            self._ctx_cache[key] = (future.result(), time.time())
+        return [self._ctx_cache[key][0] for key, _ in items]
+    
+    def _dumps_cached(self, key: str, obj) -> str:
+        """
+        Serialize a prompt fragment, reusing the text while the object
+        is unchanged.
+        
+        Retries rebuild the prompt with the very same flight_info dict;
+        keying on object identity skips the repeated json.dumps. Only
+        safe for objects that are replaced rather than mutated in place
+        (so not for state["messages"], which grows between retries).
+        
+        Args:
+            key: Cache key identifying the fragment
+            obj: The object to serialize
+            
+        Returns:
+            The JSON text for obj
+        """
+        cached = self._dumps_cache.get(key)
+        if cached is not None and cached[0] is obj:
+            return cached[1]
+        text = json.dumps(obj, indent=2)
+        self._dumps_cache[key] = (obj, text)
+        return text
+    
+    def _get_runway_status(self) -> tuple:
         """
         Get current status of all runways.
         
+        The per-runway strings are live data (status and slot end time
+        change as operations complete), so they are rebuilt here; the
+        2-second context cache bounds how often a workflow pays for it,
+        and the invariant name/heading prefix is precomputed on the
+        runway itself.
+        
         Returns:
-            List of runway detail dictionaries
+            Tuple of runway detail strings
         """
         print("[API] Fetching runway status...")
-        return [runway.get_runway_details() for runway in self.airport.runways]
+        return tuple(runway.get_runway_details() for runway in self.airport.runways)
     
     def _get_other_flights(self) -> list:
         """
@@ -187,7 +300,7 @@ class ATCAgent:
         """
         print("[API] Fetching other flights...")
         try:
-            response = requests.get(f"{API_BASE_URL}/flights/", timeout=5)
+            response = _SESSION.get(f"{API_BASE_URL}/flights/", timeout=5)
             
             # Check if request was successful
             if response.status_code != 200:
@@ -233,7 +346,7 @@ class ATCAgent:
         }
         
         try:
-            response = requests.get(f"{API_BASE_URL}/landing-rules", timeout=5)
+            response = _SESSION.get(f"{API_BASE_URL}/landing-rules", timeout=5)
             
             # Check if request was successful
             if response.status_code != 200:
@@ -282,7 +395,7 @@ class ATCAgent:
         }
         
         try:
-            response = requests.get(f"{API_BASE_URL}/waypoints", timeout=5)
+            response = _SESSION.get(f"{API_BASE_URL}/waypoints", timeout=5)
             
             # Check if request was successful
             if response.status_code != 200:
@@ -331,18 +444,31 @@ class ATCAgent:
         
         print(f"[ENTRY] Processing flight {callsign} with status: {status}")
         
+        # Bound the conversation to a rolling window: every retry folds
+        # the previous prompt into messages, and an unbounded list makes
+        # each successive prompt (and its token bill) grow quadratically
+        state["messages"] = deque(state["messages"], maxlen=20)
+        
         # Add initial system message
         state["messages"].append({
             "role": "system",
             "content": f"Flight {callsign} status: {status}"
         })
         
+        # Fresh workflow run - drop any context left over from a
+        # previous invocation so the first node fetches live data
+        self._ctx_cache.clear()
+        
         # Load previous conversation history from database
         print("[ENTRY] Loading previous conversation history...")
-        state["prev_convo"] = ATCDatabase().get_records(state['flight_id'], 5)
-        print(f"[ENTRY] Loaded {len(state['prev_convo'])} previous records")
-        
-        return state
+        # Most recent five records only - enough context for the prompt
+        # without ballooning it on chatty flights
+        prev_convo = ATCDatabase().get_records(state['flight_id'], 5)[:5]
+        print(f"[ENTRY] Loaded {len(prev_convo)} previous records")
+        
+        # Return only the channels this node changed - LangGraph merges
+        # the delta instead of copying the whole state through
+        return {"messages": state["messages"], "prev_convo": prev_convo}
     
     def _route_based_on_status(self, state: ATCState) -> Literal["landing", "takeoff", "end"]:
         """
@@ -390,23 +516,27 @@ class ATCAgent:
         
         print(f"[LANDING] Processing landing for {callsign}")
         
-        # Gather contextual information
+        # Gather contextual information (fetched concurrently, cached
+        # across safety retries)
         print("[LANDING] Gathering contextual data...")
-        weather_info = WeatherInfo().get_noaa_weather("KSEA")
-        other_flights = self._get_other_flights()
-        runway_details = self._get_runway_status()
-        landing_rules = self._get_landing_rules()
-        waypoints = self._get_waypoints()
+        weather_info, other_flights, runway_details, landing_rules, waypoints = \
+            self._gather_ctx([
+                ("weather", lambda: WeatherInfo().get_noaa_weather("KSEA")),
+                ("other_flights", self._get_other_flights),
+                ("runway_details", self._get_runway_status),
+                ("landing_rules", self._get_landing_rules),
+                ("waypoints", self._get_waypoints),
+            ])
         
         print(f"[LANDING] Context gathered - {len(other_flights)} other flights in airspace")
-        landing_prompt = LANDING_PROMPT.format(callsign=callsign,
+        landing_prompt = render_landing_prompt(callsign=callsign,
                                                waypoints=waypoints,
                                                weather_info=weather_info,
                                                runway_details=runway_details,
                                                other_flights=other_flights,
                                                landing_rules=landing_rules,
-                                               messages=json.dumps(state['messages'], indent=2),
-                                               flight_info=json.dumps(state['flight_info'], indent=2))
+                                               messages=json.dumps(list(state['messages']), indent=2),
+                                               flight_info=self._dumps_cached('flight_info', state['flight_info']))
 
         # Invoke LLM and process response
         state["messages"].append({"role": "user", "content": landing_prompt})
@@ -419,16 +549,13 @@ class ATCAgent:
             # Parse JSON from LLM output
             command = self._parse_json_from_response(llm_output)
             
-            state["command"] = command
             state["messages"].append({"role": "assistant", "content": llm_output})
-            state["result"] = command
             print(f"[LANDING] Generated command: {command}")
+            return {"command": command, "result": command, "messages": state["messages"]}
             
         except Exception as e:
             print(f"[LANDING] ERROR: {e}")
-            state["command"] = {"error": str(e)}
-        
-        return state
+            return {"command": {"error": str(e)}, "messages": state["messages"]}
     
     def takeoff_node(self, state: ATCState) -> ATCState:
         """
@@ -448,12 +575,16 @@ class ATCAgent:
         
         print(f"[TAKEOFF] Processing takeoff for {callsign}")
         
-        # Gather contextual information
+        # Gather contextual information (fetched concurrently, cached
+        # across safety retries)
         print("[TAKEOFF] Gathering contextual data...")
-        weather_info = WeatherInfo().get_noaa_weather("KSEA")
-        other_flights = self._get_other_flights()
-        runway_details = self._get_runway_status()
-        waypoints = self._get_waypoints()
+        weather_info, other_flights, runway_details, waypoints = \
+            self._gather_ctx([
+                ("weather", lambda: WeatherInfo().get_noaa_weather("KSEA")),
+                ("other_flights", self._get_other_flights),
+                ("runway_details", self._get_runway_status),
+                ("waypoints", self._get_waypoints),
+            ])
         
         print(f"[TAKEOFF] Context gathered - {len(other_flights)} other flights in airspace")
 
@@ -463,8 +594,8 @@ class ATCAgent:
                                                weather_info=weather_info,
                                                runway_details=runway_details,
                                                other_flights=other_flights,
-                                               messages=json.dumps(state['messages'], indent=2),
-                                               flight_info=json.dumps(state['flight_info'], indent=2))
+                                               messages=json.dumps(list(state['messages']), indent=2),
+                                               flight_info=self._dumps_cached('flight_info', state['flight_info']))
 
         # Invoke LLM and process response
         state["messages"].append({"role": "user", "content": takeoff_prompt})
@@ -477,16 +608,13 @@ class ATCAgent:
             # Parse JSON from LLM output
             command = self._parse_json_from_response(llm_output)
             
-            state["command"] = command
             state["messages"].append({"role": "assistant", "content": llm_output})
-            state["result"] = command
             print(f"[TAKEOFF] Generated command: {command}")
+            return {"command": command, "result": command, "messages": state["messages"]}
             
         except Exception as e:
             print(f"[TAKEOFF] ERROR: {e}")
-            state["command"] = {"error": str(e)}
-        
-        return state
+            return {"command": {"error": str(e)}, "messages": state["messages"]}
     
     def _parse_json_from_response(self, llm_output: str) -> dict:
         """
@@ -499,7 +627,7 @@ class ATCAgent:
             Parsed JSON as dictionary, or empty dict if parsing fails
         """
         # Try to find JSON in code blocks first
-        match = re.search(r"```json(.*?)```", llm_output, re.DOTALL)
+        match = _JSON_BLOCK_RE.search(llm_output)
         if match:
             json_text = match.group(1).strip()
             try:
@@ -534,87 +662,73 @@ class ATCAgent:
             state: Current workflow state
             
         Returns:
-            Updated state with validation result
+            Delta containing the validation result (and any failure
+            messages) for LangGraph to merge into the state
         """
         command = state["command"]
         if command.get("error"):
-            return state
+            return {}
+
+        from airport.saftey_checks import (
+            FlightBatch, check_enroute_conflicts,
+            find_runway_conflict, last_waypoint, predict_conflict
+        )
 
         flight_info = state["flight_info"]
         status = flight_info.get("status", "")
-        
+
         print(f"[SAFETY] Validating command: {command}")
         print(f"[SAFETY] Flight status: {status}")
         
         # Get last checkpoint from passed waypoints
-        passed_waypoints = flight_info.get("passed_waypoints", [])
-        last_checkpoint = passed_waypoints[-1] if passed_waypoints else ""
+        last_checkpoint = last_waypoint(flight_info)
         print(f"[SAFETY] Last checkpoint: {last_checkpoint or 'None'}")
         
-        # Fetch other flights for conflict detection
-        flights = self._get_other_flights()
-        
-        # Landing pattern waypoints
-        landing_pattern_waypoints = ["DOWNWIND", "BASE", "FINAL", "RUNWAY"]
-        
+        # Conflict detection reuses the traffic list the operation node
+        # fetched moments ago (TTL cache) instead of a second round-trip,
+        # packed once into aligned arrays for the checks below
+        flights = self._get_ctx("other_flights", self._get_other_flights)
+        traffic = FlightBatch.from_dicts(flights)
+
         # ----- TAKEOFF SAFETY CHECK -----
         if status in ["ready_for_takeoff", "taking_off"]:
             print("[SAFETY] Performing takeoff safety checks...")
             
             if command.get("cleared_for_takeoff"):
-                for flight in flights:
-                    flight_passed = flight.get("passed_waypoints", [])
-                    flight_last_checkpoint = flight_passed[-1] if flight_passed else ""
-                    flight_status = flight.get("status", "")
-                    
-                    # Check if runway is occupied or aircraft on final/taking off
-                    is_runway_conflict = (
-                        flight_last_checkpoint in ["FINAL", "RUNWAY"] or
-                        flight_status in ["taking_off", "landing"]
-                    )
-                    
-                    if is_runway_conflict:
-                        print(f"[SAFETY] FAILED: Runway conflict with {flight.get('callsign', 'unknown')}")
-                        state['messages'].append({
-                            "role": "user",
-                            "content": f"Failed safety check for takeoff - runway conflict with: {flight}"
-                        })
-                        state["result"] = {}
-                        return state
+                conflict = find_runway_conflict(traffic)
+                if conflict is not None:
+                    print(f"[SAFETY] FAILED: Runway conflict with {conflict.get('callsign', 'unknown')}")
+                    state['messages'].append({
+                        "role": "user",
+                        "content": f"Failed safety check for takeoff - runway conflict with: {conflict}"
+                    })
+                    return {"result": {},
+                            "messages": state["messages"],
+                            "retry_count": state.get("retry_count", 0) + 1}
             
             # Takeoff safety check passed
             print("[SAFETY] Takeoff safety check PASSED")
-            state["result"] = command
-            return state
+            return {"result": command}
         
         # ----- CLEAR TO LAND SAFETY CHECK -----
         if command.get("clear_to_land"):
             print("[SAFETY] Performing clear-to-land safety checks...")
             
-            for flight in flights:
-                flight_passed = flight.get("passed_waypoints", [])
-                flight_last_checkpoint = flight_passed[-1] if flight_passed else ""
-                flight_status = flight.get("status", "")
-                
-                # Check for conflicts: any flight on FINAL, RUNWAY, or taking off
-                is_landing_conflict = (
-                    flight_last_checkpoint in ["FINAL", "RUNWAY"] or
-                    flight_status in ["taking_off", "landing"]
-                )
-                
-                if is_landing_conflict:
-                    print(f"[SAFETY] FAILED: Landing conflict with {flight.get('callsign', 'unknown')} "
-                          f"(checkpoint: {flight_last_checkpoint}, status: {flight_status})")
-                    state['messages'].append({
-                        "role": "user",
-                        "content": f"Failed safety check for landing - conflict with: {flight}"
-                    })
-                    state["result"] = {}
-                    return state
+            conflict = find_runway_conflict(traffic)
+            if conflict is not None:
+                print(f"[SAFETY] FAILED: Landing conflict with {conflict.get('callsign', 'unknown')} "
+                      f"(checkpoint: {last_waypoint(conflict)}, "
+                      f"status: {conflict.get('status', '')})")
+                state['messages'].append({
+                    "role": "user",
+                    "content": f"Failed safety check for landing - conflict with: {conflict}"
+                })
+                return {"result": {},
+                        "messages": state["messages"],
+                        "retry_count": state.get("retry_count", 0) + 1}
             
             # Clear to land safety check passed - assign runway
             print("[SAFETY] Clear-to-land safety check PASSED")
-            state["result"] = command
             
             print("[SAFETY] Assigning runway for landing clearance...")
             try:
@@ -628,10 +742,10 @@ class ATCAgent:
             except Exception as e:
                 print(f"[SAFETY] WARNING: Failed to assign runway: {e}")
             
-            return state
+            return {"result": command}
         
         # # ----- LANDING PATTERN SAFETY CHECK (DOWNWIND -> BASE -> FINAL -> RUNWAY) -----
-        # if last_checkpoint in landing_pattern_waypoints:
+        # if last_checkpoint in LANDING_PATTERN_WAYPOINTS:
         #     target_waypoint = command.get("waypoint", "")
         #     print(f"[SAFETY] Checking landing pattern: {last_checkpoint} -> {target_waypoint}")
             
@@ -659,45 +773,44 @@ class ATCAgent:
         # ----- EN-ROUTE COLLISION DETECTION (for random waypoints) -----
         # Only check against non-landing flights
         print("[SAFETY] Performing collision detection for en-route aircraft...")
-        
-        from airport.saftey_checks import predict_conflict
-        
-        for flight in flights:
-            flight_status = flight.get("status", "")
-            flight_passed = flight.get("passed_waypoints", [])
-            flight_last = flight_passed[-1] if flight_passed else ""
-            
-            # Skip landing flights (in the landing pattern or actively landing)
-            if flight_status in ["landing", "on_final"] or flight_last in landing_pattern_waypoints:
-                print(f"[SAFETY] Skipping landing flight {flight.get('callsign', 'unknown')}")
-                continue
-            
-            # Use predict_conflict - check the 'will_conflict' key in the result
+
+        # One vectorized CPA pass over the batch instead of a Python
+        # predict_conflict call per flight; landing-pattern traffic is
+        # masked out inside the check
+        conflict_idx = check_enroute_conflicts(
+            flight_info,
+            traffic,
+            horizon_min=2.0,  # Check 2 minutes ahead
+            horizontal_threshold_nm=5.0,
+            vertical_threshold_ft=1000.0
+        )
+
+        if conflict_idx is not None:
+            flight = traffic.flights[conflict_idx]
+            # Re-run the scalar check on the one offending pair for the
+            # detailed conflict timing used in the report
             conflict_result = predict_conflict(
-                flight_info, 
+                flight_info,
                 flight,
-                horizon_min=2.0,  # Check 2 minutes ahead
+                horizon_min=2.0,
                 horizontal_threshold_nm=5.0,
                 vertical_threshold_ft=1000.0
             )
-            
-            if conflict_result.get("will_conflict"):
-                print(f"[SAFETY] FAILED: Collision risk with {flight.get('callsign', 'unknown')}")
-                print(f"[SAFETY] Conflict details: time={conflict_result.get('time_of_conflict_min', 'N/A'):.2f}min, "
-                      f"h_sep={conflict_result.get('min_horizontal_nm', 'N/A'):.2f}NM, "
-                      f"v_sep={conflict_result.get('min_vertical_ft', 'N/A'):.0f}ft")
-                state['messages'].append({
-                    "role": "user",
-                    "content": f"Failed safety check - collision risk (<1000ft separation) with: {flight}"
-                })
-                state["result"] = {}
-                return state
+            print(f"[SAFETY] FAILED: Collision risk with {flight.get('callsign', 'unknown')}")
+            print(f"[SAFETY] Conflict details: time={conflict_result.get('time_of_conflict_min', 'N/A'):.2f}min, "
+                  f"h_sep={conflict_result.get('min_horizontal_nm', 'N/A'):.2f}NM, "
+                  f"v_sep={conflict_result.get('min_vertical_ft', 'N/A'):.0f}ft")
+            state['messages'].append({
+                "role": "user",
+                "content": f"Failed safety check - collision risk (<1000ft separation) with: {flight}"
+            })
+            return {"result": {},
+                    "messages": state["messages"],
+                    "retry_count": state.get("retry_count", 0) + 1}
         
         # All safety checks passed
         print("[SAFETY] All safety checks PASSED")
-        state["result"] = command
-        
-        return state
+        return {"result": command}
     
     def _route_after_safety_check(self, state: ATCState) -> Literal["retry_landing", "retry_takeoff", "end"]:
         """
@@ -710,6 +823,9 @@ class ATCAgent:
             Route identifier for retry or end
         """
         result = state.get("result", {})
+        # safety_check increments retry_count in its failure delta - a
+        # mutation made here in the routing function would be lost, as
+        # LangGraph hands edges a fresh snapshot of the channels
         retry_count = state.get("retry_count", 0)
         max_retries = 3
         
@@ -718,23 +834,20 @@ class ATCAgent:
             print("[ROUTING] Safety check passed -> end")
             return "end"
         
-        # Check retry limit
-        if retry_count >= max_retries:
+        # Check retry limit (retry_count already counts this failure)
+        if retry_count > max_retries:
             print(f"[ROUTING] Max retries ({max_retries}) reached -> end")
             return "end"
         
-        # Increment retry count
-        state["retry_count"] = retry_count + 1
-        
         # Retry based on flight status
         status = state["flight_info"].get("status", "")
         
         if status in ["approaching", "on_final", "landing"]:
-            print(f"[ROUTING] Retrying landing (attempt {retry_count + 1}/{max_retries})")
+            print(f"[ROUTING] Retrying landing (attempt {retry_count}/{max_retries})")
             return "retry_landing"
         
         if status in ["ready_for_takeoff", "taking_off"]:
-            print(f"[ROUTING] Retrying takeoff (attempt {retry_count + 1}/{max_retries})")
+            print(f"[ROUTING] Retrying takeoff (attempt {retry_count}/{max_retries})")
             return "retry_takeoff"
         
         print("[ROUTING] Unknown status -> end")
@@ -744,6 +857,83 @@ class ATCAgent:
     # Public Methods
     # ========================================================================
     
+    def run_batch(self, flight_infos: list) -> dict:
+        """
+        Decide commands for several flights with one LLM call per batch.
+        
+        Instead of one Gemini round-trip per flight, the flights are
+        folded into a single prompt (MAX_BATCH_SIZE per call) as
+        <flight id="..."> sections sharing one copy of the airspace
+        context, and the model returns a JSON array of decisions.
+        Intended for routine vectoring sweeps; flights needing the full
+        safety-retry loop should go through run() individually.
+        
+        Args:
+            flight_infos: List of flight info dictionaries to control
+            
+        Returns:
+            Dictionary mapping callsign to the decided command dict
+        """
+        if not flight_infos:
+            return {}
+        
+        batch_callsigns = {f.get("callsign") for f in flight_infos}
+        commands = {}
+        
+        for start in range(0, len(flight_infos), MAX_BATCH_SIZE):
+            batch = flight_infos[start:start + MAX_BATCH_SIZE]
+            print(f"[BATCH] Deciding {len(batch)} flights in one LLM call...")
+            
+            # One copy of the shared context per batch
+            weather_info, other_flights, runway_details, landing_rules, waypoints = \
+                self._gather_ctx([
+                    ("weather", lambda: WeatherInfo().get_noaa_weather("KSEA")),
+                    ("other_flights", self._get_other_flights),
+                    ("runway_details", self._get_runway_status),
+                    ("landing_rules", self._get_landing_rules),
+                    ("waypoints", self._get_waypoints),
+                ])
+            # Flights controlled in this batch are not "other traffic"
+            other_flights = [f for f in other_flights
+                             if f.get("callsign") not in batch_callsigns]
+            
+            flight_sections = "\n".join(
+                f'<flight id="{info.get("callsign")}">\n'
+                f'{json.dumps(info, indent=2)}\n'
+                f'</flight>'
+                for info in batch
+            )
+            
+            batch_prompt = BATCH_PROMPT.format(flight_sections=flight_sections,
+                                               waypoints=waypoints,
+                                               weather_info=weather_info,
+                                               runway_details=runway_details,
+                                               other_flights=other_flights,
+                                               landing_rules=landing_rules)
+            
+            try:
+                response = self.llm.invoke(batch_prompt)
+                llm_output = response if isinstance(response, str) else str(response)
+                decisions = self._parse_json_from_response(llm_output)
+            except Exception as e:
+                print(f"[BATCH] ERROR: {e}")
+                continue
+            
+            if not isinstance(decisions, list):
+                print("[BATCH] WARNING: expected a JSON array of decisions")
+                continue
+            
+            for decision in decisions:
+                callsign = decision.get("callsign") if isinstance(decision, dict) else None
+                if callsign in batch_callsigns and isinstance(decision.get("command"), dict):
+                    commands[callsign] = decision["command"]
+                else:
+                    print(f"[BATCH] WARNING: dropping malformed decision: {decision}")
+            
+            print(f"[BATCH] Parsed {len(commands)} commands so far")
+        
+        return commands
+    
     def run(self) -> dict:
         """
         Execute the ATC workflow for the flight.
@@ -757,7 +947,13 @@ class ATCAgent:
         
         # Invoke the workflow
         result = self.workflow.invoke(self.state)
-        
+
+        # The rolling message window lives in a deque inside the workflow;
+        # hand callers a plain list so the final state stays JSON-friendly
+        # (insert_record serializes it straight into the ATC record)
+        if "messages" in result:
+            result["messages"] = list(result["messages"])
+
         print(f"\n{'='*60}")
         print(f"  ATC AGENT COMPLETED FOR FLIGHT: {self.flight_id}")
         print(f"  Final Result: {result.get('result', {})}")
@@ -801,7 +997,7 @@ def main(flight_info: dict, airport: Airport) -> None:
         url = f"{API_BASE_URL}/flights/{flight_id}/command"
         
         try:
-            response = requests.post(url, json=command, headers=headers)
+            response = _SESSION.post(url, json=command, headers=headers)
             print(f"[MAIN] Simulator response: {response.status_code}")
         except Exception as e:
             print(f"[MAIN] ERROR sending command: {e}")
@@ -815,3 +1011,80 @@ def main(flight_info: dict, airport: Airport) -> None:
         )
     else:
         print(f"[MAIN] No command generated for flight {flight_id}")
+
+
+# ============================================================================
+# Async Entry Points
+# ============================================================================
+
+# Shared async HTTP client, created lazily inside the running event loop
+_ASYNC_CLIENT = None
+
+
+def _get_async_client() -> httpx.AsyncClient:
+    """Return the shared AsyncClient, creating it on first use."""
+    global _ASYNC_CLIENT
+    if _ASYNC_CLIENT is None:
+        _ASYNC_CLIENT = httpx.AsyncClient(
+            timeout=5, limits=httpx.Limits(max_connections=64)
+        )
+    return _ASYNC_CLIENT
+
+
+async def process_flight(flight_info: dict, airport: Airport) -> None:
+    """
+    Async counterpart of main() for concurrent flight processing.
+    
+    The LangGraph workflow (and the blocking HTTP/LLM calls inside it)
+    runs in a worker thread via asyncio.to_thread, so one event loop
+    can interleave many flights instead of handling them back to back.
+    The resulting command is POSTed through the shared httpx client
+    without blocking the loop.
+    
+    Args:
+        flight_info: Dictionary containing flight information
+        airport: Airport object with runway configuration
+    """
+    flight_id = flight_info['callsign']
+    print(f"[MAIN] Starting async ATC processing for flight {flight_id}")
+    
+    agent = ATCAgent(airport, flight_id, flight_info)
+    result = await asyncio.to_thread(agent.run)
+    
+    command = result.get('result', {})
+    if not command:
+        print(f"[MAIN] No command generated for flight {flight_id}")
+        return
+    
+    print(f"[MAIN] Sending command to simulator: {command}")
+    try:
+        response = await _get_async_client().post(
+            f"{API_BASE_URL}/flights/{flight_id}/command", json=command
+        )
+        print(f"[MAIN] Simulator response: {response.status_code}")
+    except Exception as e:
+        print(f"[MAIN] ERROR sending command: {e}")
+    
+    # sqlite insert stays blocking - push it off the loop as well
+    await asyncio.to_thread(
+        ATCDatabase().insert_record,
+        command=command,
+        result=result,
+        flight_id=flight_id,
+        flight_info=flight_info,
+        retry_count=result.get("retry_count", 0),
+    )
+
+
+async def process_flights(flight_infos: list, airport: Airport) -> None:
+    """
+    Process a batch of flights concurrently.
+    
+    Args:
+        flight_infos: List of flight info dictionaries
+        airport: Airport object with runway configuration
+    """
+    await asyncio.gather(
+        *(process_flight(info, airport) for info in flight_infos),
+        return_exceptions=True,
+    )
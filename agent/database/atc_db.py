@@ -2,12 +2,21 @@ import sqlite3
 import json
 from typing import Dict, Any, Optional, List
 
+from utils.singleton import SingletonMeta
+
 
 DB_NAME = "atc.db"
 TABLE_NAME = "atc_communication"
 
 
-class ATCDatabase:
+class ATCDatabase(metaclass=SingletonMeta):
+    """ATC communication log store.
+
+    Singleton: ATCDatabase() is constructed all over the workflow (entry
+    node, command dispatch), and every call now returns the same handle
+    instead of re-running the table-existence check per call. A custom
+    db_path therefore only takes effect on the first construction.
+    """
     def __init__(self, db_path: str = DB_NAME):
         self.db_path = db_path
         # Create table only if it doesn't exist
@@ -1,81 +1,166 @@
+import functools
 import sqlite3
-import json
+import threading
 from typing import Dict, Any, Optional, List
 
+import numpy as np
+import orjson
+
 DB_NAME = "atc.db"
 
+# Shared statement text. sqlite3 caches compiled statements per connection
+# keyed on the exact SQL string, so issuing byte-identical text from every
+# call site means each statement is planned once and reused.
+INSERT_SQL = """
+    INSERT INTO flights (
+        callsign, flight_type, status,
+        position_x, position_y,
+        altitude, speed, heading,
+        target_altitude, target_speed, target_heading,
+        target_waypoint,
+        aircraft_type, origin, destination,
+        cleared_to_land, cleared_for_takeoff,
+        passed_waypoints, clearance_denial_reason
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+UPDATE_BY_CALLSIGN_SQL = """
+    UPDATE flights SET
+        flight_type=?, status=?,
+        position_x=?, position_y=?,
+        altitude=?, speed=?, heading=?,
+        target_altitude=?, target_speed=?, target_heading=?,
+        target_waypoint=?,
+        aircraft_type=?, origin=?, destination=?,
+        cleared_to_land=?, cleared_for_takeoff=?,
+        passed_waypoints=?, clearance_denial_reason=?
+    WHERE callsign=?
+"""
+
+
+@functools.lru_cache(maxsize=64)
+def _build_update_sql(cols: tuple) -> str:
+    """Build (and memoize) an UPDATE statement for a given column set."""
+    return "UPDATE flights SET " + ", ".join(f"{col}=?" for col in cols) + " WHERE id=?"
+
+
+def _pack_waypoints(waypoints) -> bytes:
+    """Serialize a passed_waypoints list for storage."""
+    return orjson.dumps(waypoints or [])
+
+
+def _unpack_waypoints(raw) -> list:
+    """Deserialize a stored passed_waypoints value (bytes, or legacy text)."""
+    return orjson.loads(raw) if raw else []
+
+
+# Let sqlite3 convert Python values at bind time instead of every call
+# site pre-converting: booleans store as integers, waypoint lists as
+# packed blobs. Registered once at import; adapters are process-wide.
+sqlite3.register_adapter(bool, int)
+sqlite3.register_adapter(list, _pack_waypoints)
+
 class FlightDatabase:
     def __init__(self, db_path: str = DB_NAME):
         self.db_path = db_path
-        if not self._table_exists("flights"):
-            self._create_table()
-
-    def _table_exists(self, table_name: str) -> bool:
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT name FROM sqlite_master
-            WHERE type='table' AND name=?;
-        """, (table_name,))
-        exists = cursor.fetchone() is not None
-        conn.close()
-        return exists
-
-    def _create_table(self):
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("""
-            CREATE TABLE flights (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                callsign TEXT,
-                flight_type TEXT,
-                status TEXT,
-                position_x REAL,
-                position_y REAL,
-                altitude INTEGER,
-                speed REAL,
-                heading REAL,
-                target_altitude INTEGER,
-                target_speed REAL,
-                target_heading REAL,
-                target_waypoint TEXT,
-                aircraft_type TEXT,
-                origin TEXT,
-                destination TEXT,
-                cleared_to_land INTEGER,
-                cleared_for_takeoff INTEGER,
-                passed_waypoints TEXT,
-                clearance_denial_reason TEXT,
-                created_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            );
-        """)
-        conn.commit()
-        conn.close()
+        # One connection for the lifetime of the instance - opening and
+        # closing sqlite3 connections per call re-reads the schema and
+        # throws away the page cache every time. The lock serializes use
+        # across threads since check_same_thread is disabled.
+        self._conn = self._connect()
+        self._lock = threading.Lock()
+        self._ensure_schema()
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open a connection with tuned PRAGMAs.
+        WAL lets the polling reader and the agent writers proceed without
+        blocking each other; the remaining PRAGMAs trade a little durability
+        for far fewer fsyncs and more page cache.
+        """
+        conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                               isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        if self.db_path != ":memory:":
+            conn.executescript("""
+                PRAGMA journal_mode=WAL;
+                PRAGMA synchronous=NORMAL;
+                PRAGMA temp_store=MEMORY;
+                PRAGMA cache_size=-64000;
+                PRAGMA mmap_size=268435456;
+                PRAGMA wal_autocheckpoint=1000;
+            """)
+        return conn
+
+    def close(self):
+        """Close the underlying connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _ensure_schema(self):
+        """
+        Create the flights table and its indexes if they are missing.
+        IF NOT EXISTS makes this a no-op on an already-initialized file, so
+        there's no separate existence probe before the DDL.
+        """
+        with self._lock:
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS flights (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    callsign TEXT,
+                    flight_type TEXT,
+                    status TEXT,
+                    position_x REAL,
+                    position_y REAL,
+                    altitude INTEGER,
+                    speed REAL,
+                    heading REAL,
+                    target_altitude INTEGER,
+                    target_speed REAL,
+                    target_heading REAL,
+                    target_waypoint TEXT,
+                    aircraft_type TEXT,
+                    origin TEXT,
+                    destination TEXT,
+                    cleared_to_land INTEGER,
+                    cleared_for_takeoff INTEGER,
+                    passed_waypoints TEXT,
+                    clearance_denial_reason TEXT,
+                    created_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                );
+
+                -- Every lookup in the polling loop and the agent filters on
+                -- callsign or status and sorts on created_time; without these
+                -- each query is a full table scan.
+                CREATE INDEX IF NOT EXISTS idx_flights_callsign
+                    ON flights(callsign);
+                CREATE INDEX IF NOT EXISTS idx_flights_status
+                    ON flights(status);
+                CREATE INDEX IF NOT EXISTS idx_flights_created_time
+                    ON flights(created_time DESC);
+
+                ANALYZE;
+            """)
 
     # ---------------------------
     # Insert a new flight
     # ---------------------------
     def insert_flight(self, flight: dict) -> int:
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            INSERT INTO flights (
-                callsign, flight_type, status,
-                position_x, position_y,
-                altitude, speed, heading,
-                target_altitude, target_speed, target_heading,
-                target_waypoint,
-                aircraft_type, origin, destination,
-                cleared_to_land, cleared_for_takeoff,
-                passed_waypoints, clearance_denial_reason
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+        with self._lock:
+            cursor = self._conn.execute(INSERT_SQL, self._flight_values(flight))
+            return cursor.lastrowid
+
+
+    @staticmethod
+    def _flight_values(flight: dict) -> tuple:
+        """Bind values for the 19 writable flight columns, in insert order."""
+        position = flight.get("position") or {}
+        return (
             flight.get("callsign"),
             flight.get("flight_type"),
             flight.get("status"),
-            flight.get("position", {}).get("x") if flight.get("position") else None,
-            flight.get("position", {}).get("y") if flight.get("position") else None,
+            position.get("x"),
+            position.get("y"),
             flight.get("altitude"),
             flight.get("speed"),
             flight.get("heading"),
@@ -86,25 +171,58 @@ class FlightDatabase:
             flight.get("aircraft_type"),
             flight.get("origin"),
             flight.get("destination"),
-            int(flight.get("cleared_to_land", False)),
-            int(flight.get("cleared_for_takeoff", False)),
-            json.dumps(flight.get("passed_waypoints", [])),
-            flight.get("clearance_denial_reason")
-        ))
-
-        conn.commit()
-        flight_id = cursor.lastrowid
-        conn.close()
-        return flight_id
+            flight.get("cleared_to_land", False),
+            flight.get("cleared_for_takeoff", False),
+            flight.get("passed_waypoints") or [],
+            flight.get("clearance_denial_reason"),
+        )
 
+    # ---------------------------
+    # Insert or update a batch of flights in one transaction
+    # ---------------------------
+    def upsert_many(self, flights: List[dict]):
+        """
+        Write a whole poll cycle's worth of flights at once: one SELECT to
+        split the batch into new vs. known callsigns, then one executemany
+        per kind inside a single transaction instead of a commit per flight.
+        """
+        if not flights:
+            return
+
+        callsigns = [f.get("callsign") for f in flights]
+        placeholders = ", ".join("?" * len(callsigns))
+
+        with self._lock:
+            known = {row["callsign"] for row in self._conn.execute(
+                f"SELECT callsign FROM flights WHERE callsign IN ({placeholders})",
+                callsigns)}
+
+            inserts = [self._flight_values(f) for f in flights
+                       if f.get("callsign") not in known]
+            updates = [self._flight_values(f)[1:] + (f.get("callsign"),)
+                       for f in flights if f.get("callsign") in known]
+
+            self._conn.execute("BEGIN")
+            try:
+                if inserts:
+                    self._conn.executemany(INSERT_SQL, inserts)
+                if updates:
+                    self._conn.executemany(UPDATE_BY_CALLSIGN_SQL, updates)
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
 
     # ---------------------------
     # Fetch flights optionally by callsign or status
     # ---------------------------
-    def get_flights(self, callsign: Optional[str] = None, status: Optional[str] = None) -> list:
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
+    def get_flights(self, callsign: Optional[str] = None, status: Optional[str] = None,
+                    limit: Optional[int] = None) -> list:
+        """
+        Fetch flights, newest first, optionally filtered by callsign and/or
+        status. Pass limit=1 for latest-row lookups so sqlite stops at the
+        first index hit instead of materializing the whole history.
+        """
         query = "SELECT * FROM flights"
         params = []
         clauses = []
@@ -121,76 +239,85 @@ class FlightDatabase:
 
         query += " ORDER BY created_time DESC"
 
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
-        conn.close()
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+
+        return [self._row_to_flight(row) for row in rows]
+
+    @staticmethod
+    def _row_to_flight(row: sqlite3.Row) -> dict:
+        """Convert a flights row into the dict shape the agent code expects."""
+        flight = dict(row)
+        flight["position"] = {"x": flight.pop("position_x"),
+                              "y": flight.pop("position_y")}
+        flight["cleared_to_land"] = bool(flight["cleared_to_land"])
+        flight["cleared_for_takeoff"] = bool(flight["cleared_for_takeoff"])
+        flight["passed_waypoints"] = _unpack_waypoints(flight["passed_waypoints"])
+        return flight
 
-        flights = []
+    def get_flights_by_callsigns(self, callsigns: List[str]) -> Dict[str, dict]:
+        """
+        Fetch the latest row for each of the given callsigns in one query,
+        keyed by callsign. Lets the polling loop look up a whole cycle's
+        flights without a SELECT per callsign.
+        """
+        if not callsigns:
+            return {}
+
+        placeholders = ", ".join("?" * len(callsigns))
+        query = (f"SELECT * FROM flights WHERE callsign IN ({placeholders}) "
+                 "ORDER BY created_time DESC")
+
+        with self._lock:
+            rows = self._conn.execute(query, list(callsigns)).fetchall()
+
+        flights: Dict[str, dict] = {}
         for row in rows:
-            flights.append({
-                "id": row[0],
-                "callsign": row[1],
-                "flight_type": row[2],
-                "status": row[3],
-                "position": {"x": row[4], "y": row[5]},
-                "altitude": row[6],
-                "speed": row[7],
-                "heading": row[8],
-                "target_altitude": row[9],
-                "target_speed": row[10],
-                "target_heading": row[11],
-                "target_waypoint": row[12],
-                "aircraft_type": row[13],
-                "origin": row[14],
-                "destination": row[15],
-                "cleared_to_land": bool(row[16]),
-                "cleared_for_takeoff": bool(row[17]),
-                "passed_waypoints": json.loads(row[18]) if row[18] else [],
-                "clearance_denial_reason": row[19],
-                "created_time": row[20]
-            })
+            # Rows come back newest first, so the first hit per callsign wins.
+            flights.setdefault(row["callsign"], self._row_to_flight(row))
         return flights
-    
+
+    def get_positions_array(self):
+        """
+        Return (callsigns, positions) for all airborne-pattern flights:
+        callsigns as a list and positions as an (n, 2) float32 array.
+        Feeds vectorized separation math without building a dict per flight.
+        """
+        with self._lock:
+            rows = self._conn.execute("""
+                SELECT callsign, position_x, position_y FROM flights
+                WHERE status NOT IN ('landing', 'takeoff')
+                  AND position_x IS NOT NULL AND position_y IS NOT NULL
+            """).fetchall()
+
+        callsigns = [row["callsign"] for row in rows]
+        positions = np.fromiter(
+            (coord for row in rows for coord in (row["position_x"], row["position_y"])),
+            dtype=np.float32, count=2 * len(rows),
+        ).reshape(-1, 2)
+        return callsigns, positions
+
     def update_status(self, flight_id: int, status: str):
         """
         Update the status of a flight.
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            UPDATE flights
-            SET status = ?
-            WHERE id = ?
-        """, (status, flight_id))
-
-        conn.commit()
-        conn.close()
+        self.update_flight(flight_id, {"status": status})
 
     # ---------------------------
     # Update flight clearance
     # ---------------------------
     def update_clearance(self, flight_id: int, cleared_to_land: Optional[bool] = None, cleared_for_takeoff: Optional[bool] = None):
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        updates = []
-        params = []
-
+        updates = {}
         if cleared_to_land is not None:
-            updates.append("cleared_to_land = ?")
-            params.append(int(cleared_to_land))
+            updates["cleared_to_land"] = cleared_to_land
         if cleared_for_takeoff is not None:
-            updates.append("cleared_for_takeoff = ?")
-            params.append(int(cleared_for_takeoff))
-
+            updates["cleared_for_takeoff"] = cleared_for_takeoff
         if updates:
-            query = f"UPDATE flights SET {', '.join(updates)} WHERE id = ?"
-            params.append(flight_id)
-            cursor.execute(query, params)
-            conn.commit()
-
-        conn.close()
+            self.update_flight(flight_id, updates)
 
     def update_flight(self, flight_id: int, updates: Dict[str, Any]):
         """
@@ -200,10 +327,7 @@ class FlightDatabase:
         - passed_waypoints (stored as JSON)
         """
 
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        set_parts = []
+        cols = []
         params = []
 
         mapping = {
@@ -226,31 +350,25 @@ class FlightDatabase:
 
         for key, col in mapping.items():
             if key in updates:
-                value = updates[key]
-                if key in ["cleared_to_land", "cleared_for_takeoff"]:
-                    value = int(value)
-                set_parts.append(f"{col}=?")
-                params.append(value)
+                cols.append(col)
+                params.append(updates[key])
 
         # position
         if "position" in updates:
-            set_parts.append("position_x=?")
+            cols.append("position_x")
             params.append(updates["position"].get("x"))
-            set_parts.append("position_y=?")
+            cols.append("position_y")
             params.append(updates["position"].get("y"))
 
-        # passed_waypoints
+        # passed_waypoints (the list adapter packs it at bind time)
         if "passed_waypoints" in updates:
-            set_parts.append("passed_waypoints=?")
-            params.append(json.dumps(updates["passed_waypoints"]))
+            cols.append("passed_waypoints")
+            params.append(updates["passed_waypoints"])
 
-        if set_parts:
-            query = "UPDATE flights SET " + ", ".join(set_parts) + " WHERE id=?"
+        if cols:
             params.append(flight_id)
-            cursor.execute(query, params)
-            conn.commit()
-
-        conn.close()
+            with self._lock:
+                self._conn.execute(_build_update_sql(tuple(cols)), params)
 
 if __name__ == "__main__":
 
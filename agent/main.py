@@ -1,5 +1,7 @@
-import requests
-import time
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
 from database.flights_db import FlightDatabase
 from airport.airport import Airport
 from airport.runway import Runway
@@ -9,55 +11,134 @@ from config import API_BASE_URL
 
 db = FlightDatabase()
 
-URL = f"{API_BASE_URL}/flights/"
+# No trailing slash: the route is /api/flights, and httpx doesn't follow
+# the 307 redirect the slashed form triggers (requests silently did)
+URL = f"{API_BASE_URL}/flights"
 SLEEP_SECONDS = 5
 
-airport = Airport("JFK", "John F. Kennedy International Airport")
-runway1 = Runway("R1", "21L", "340")
-airport.add_runway(runway1)
+# Fields the simulator actually moves between polls; anything else
+# (callsign, aircraft type, origin, ...) is fixed at spawn time.
+WATCHED_KEYS = (
+    "status", "position", "altitude", "speed", "heading",
+    "target_altitude", "target_speed", "target_heading",
+    "target_waypoint", "cleared_to_land", "cleared_for_takeoff",
+    "passed_waypoints", "clearance_denial_reason",
+)
 
-while True:
-    try:
-        response = requests.get(URL)
 
-        if response.status_code == 200:
-            flights_data = response.json()
+def has_changes(db_data: dict, flight: dict) -> bool:
+    """Whether any watched field differs between the stored row and the poll."""
+    return any(db_data.get(key) != flight.get(key) for key in WATCHED_KEYS)
 
-            for flight in flights_data:
-                callsign = flight.get("callsign")
-                existing = db.get_flights(callsign=callsign)
+airport = Airport("JFK", "John F. Kennedy International Airport")
+runway1 = Runway("R1", "21L", "340")
+airport.add_runway(runway1)
 
-                updated = False
+# Dedicated pool for agent runs so slow LLM calls can't exhaust the
+# default executor, plus the set of callsigns currently being worked on:
+# an agent run can outlast a poll cycle and the same flight must not get
+# two concurrent (possibly contradictory) decisions.
+EXECUTOR = ThreadPoolExecutor(max_workers=8)
+in_flight: set = set()
 
-                if not existing:
-                    db.insert_flight(flight)
-                    updated = True
 
-                else:
-                    db_data = existing[0]
+def dispatch(flight):
+    """Run the agent for one flight, releasing its in-flight slot when done."""
+    try:
+        main(flight, airport)
+    finally:
+        in_flight.discard(flight.get("callsign"))
+
+
+def _report_dispatch_error(task):
+    error = task.exception()
+    if error:
+        print("Error:", error)
+
+
+async def poll():
+    """
+    Poll the simulator and dispatch agents for flights that need a decision.
+
+    The HTTP fetch is async so the sleep between cycles doesn't block the
+    event loop; the per-flight agent runs (sync LangGraph workflows) go to
+    a bounded thread pool and are allowed to outlast the cycle, with the
+    in_flight set preventing a second dispatch for a flight whose agent is
+    still running.
+    """
+    loop = asyncio.get_running_loop()
+    etag = None
+    flights_data = []  # last-known payload, reused when the server says 304
+
+    async with httpx.AsyncClient(timeout=10) as client:
+        while True:
+            try:
+                # Revalidate with If-None-Match: when nothing changed since
+                # the last poll the simulator answers 304 with an empty body
+                # and the parse/upsert half of the cycle is skipped. The
+                # dispatch pass below still runs on the cached payload -
+                # conditions like "waiting on a takeoff clearance" must
+                # re-fire even while the airspace itself is static.
+                headers = {"If-None-Match": etag} if etag else {}
+                response = await client.get(URL, headers=headers)
+
+                if response.status_code == 200:
+                    etag = response.headers.get("etag")
+                    flights_data = response.json()
+                elif response.status_code != 304:
+                    print("Error fetching flights:", response.status_code)
+                    await asyncio.sleep(SLEEP_SECONDS)
+                    continue
 
-                    if (
+                existing_by_callsign = db.get_flights_by_callsigns(
+                    [f.get("callsign") for f in flights_data])
+
+                if response.status_code == 200:
+                    # Only write flights that are new or actually moved;
+                    # rewriting identical rows just churns the WAL. The
+                    # whole batch still goes through one transaction.
+                    db.upsert_many([
+                        f for f in flights_data
+                        if f.get("callsign") not in existing_by_callsign
+                        or has_changes(existing_by_callsign[f.get("callsign")], f)
+                    ])
+
+                for flight in flights_data:
+                    callsign = flight.get("callsign")
+                    db_data = existing_by_callsign.get(callsign)
+
+                    # A flight needs a decision when it's new or its
+                    # progress changed, when it reached its current
+                    # target waypoint, when it's waiting on a takeoff
+                    # clearance, or when it has no target at all. The
+                    # old code let the at-target check overwrite the
+                    # changed check, so progressed flights whose target
+                    # wasn't reached yet were silently skipped.
+                    changed = db_data is None or (
                         db_data["status"] != flight["status"] or
                         db_data["passed_waypoints"] != flight["passed_waypoints"]
-                    ):
-                        updated = True
+                    )
+                    passed = flight['passed_waypoints']
+                    at_target_wp = bool(passed) and passed[-1] == flight['target_waypoint']
 
-                    db.update_flight(db_data["id"], flight)
-                if flight['passed_waypoints'] and flight['passed_waypoints'][-1] == flight['target_waypoint']:
-                    updated = True
-                else:
-                    updated = False
+                    if flight["status"] in ["landing", "takeoff"]:
+                        continue
 
-                if flight["status"] in ["landing", "takeoff"]:
-                    continue
+                    if callsign in in_flight:
+                        continue
+
+                    if (changed or at_target_wp
+                            or (flight['status'] == "ready_for_takeoff" and not flight['cleared_for_takeoff'])
+                            or not flight['target_waypoint']):
+                        in_flight.add(callsign)
+                        task = loop.run_in_executor(EXECUTOR, dispatch, flight)
+                        task.add_done_callback(_report_dispatch_error)
 
-                if updated or (flight['status']=="ready_for_takeoff" and not flight['cleared_for_takeoff']) or not flight['target_waypoint']:
-                    main(flight, airport)
+            except Exception as e:
+                print("Error:", e)
 
-        else:
-            print("Error fetching flights:", response.status_code)
+            await asyncio.sleep(SLEEP_SECONDS)
 
-    except Exception as e:
-        print("Error:", e)
 
-    time.sleep(SLEEP_SECONDS)
+if __name__ == "__main__":
+    asyncio.run(poll())
@@ -0,0 +1,61 @@
+BATCH_PROMPT = """
+You are an Air Traffic Controller for Runway 34. Decide the next ATC command
+for EVERY flight listed below in a single pass. All flights share the same
+airspace, so sequence them against each other as well as the other traffic.
+
+═══════════════════════════════════════════════════════════════════════════════
+PART 1: SHARED SITUATION
+═══════════════════════════════════════════════════════════════════════════════
+
+<environment>
+Waypoints: {waypoints}  # Each contains: position (x,y), altitude_restriction
+Weather: {weather_info}
+Runway: {runway_details}
+Other traffic: {other_flights}
+Landing rules: {landing_rules}
+</environment>
+
+═══════════════════════════════════════════════════════════════════════════════
+PART 2: FLIGHTS TO CONTROL
+═══════════════════════════════════════════════════════════════════════════════
+
+{flight_sections}
+
+═══════════════════════════════════════════════════════════════════════════════
+PART 3: RULES
+═══════════════════════════════════════════════════════════════════════════════
+
+**THE GOLDEN RULE: DOWNWIND → BASE → FINAL → CLEARED_TO_LAND**
+
+1. **NEVER skip waypoints** - every arrival must pass DOWNWIND → BASE → FINAL
+   in order before a landing clearance
+2. **NEVER reverse sequence** - no FINAL → BASE or BASE → DOWNWIND
+3. **Maintain minimum 5 nautical miles separation** - project where each
+   aircraft will be, including the other flights in this batch, before
+   advancing anyone to the next pattern stage
+4. **One aircraft on the runway at a time** - never clear a landing or a
+   takeoff while another aircraft is on FINAL, on the RUNWAY, landing, or
+   taking off
+5. **Resets always go to DOWNWIND** - a redirected aircraft holds at a safe
+   waypoint (HOTEL, ALPHA, CHARLIE, WEST, EAST, ...) and then restarts the
+   sequence from DOWNWIND
+
+## OUTPUT FORMAT
+
+Your response must be ONLY a valid JSON array with exactly one entry per
+flight listed in PART 2, in any order:
+
+```json
+[
+  {{"callsign": "UAL123", "command": {{"waypoint": "DOWNWIND", "altitude": 2000, "speed": 150}}}},
+  {{"callsign": "DAL456", "command": {{"clear_to_land": true}}}},
+  {{"callsign": "ASA789", "command": {{"cleared_for_takeoff": true}}}}
+]
+```
+
+Each "command" uses the same formats as single-flight control: a waypoint
+vector (waypoint/altitude/speed), a landing clearance, or a takeoff
+clearance. Output ONLY the JSON array - no explanations, no additional text.
+
+Response (JSON only):
+"""
@@ -417,4 +417,25 @@ EXECUTION CHECKLIST
         # Provide the next appropriate ATC command in the specified JSON format.
 
         # Response (JSON only):
-        # """
\ No newline at end of file
+        # """
+
+# Pre-parse the template once at import: str.format re-scans all ~24 KB
+# of this text for placeholders on every call, but the template itself
+# never changes. string.Formatter.parse processes the {{ }} escapes
+# exactly like .format, so rendering is just a join over cached parts.
+from string import Formatter as _Formatter
+
+_PARTS = []
+for _literal, _field, _spec, _conv in _Formatter().parse(LANDING_PROMPT):
+    if _literal:
+        _PARTS.append((False, _literal))
+    if _field is not None:
+        _PARTS.append((True, _field))
+
+
+def render_landing_prompt(**values) -> str:
+    """Substitute placeholder values without re-parsing the template."""
+    return "".join(
+        str(values[text]) if is_field else text
+        for is_field, text in _PARTS
+    )
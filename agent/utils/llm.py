@@ -1,64 +1,141 @@
 from config import GEMINI_API_KEY
 import google.generativeai as genai
+import random
 import time
+
+from utils.singleton import SingletonMeta
  
 
 # Configure Google Gemini API key
 genai.configure(api_key=GEMINI_API_KEY)
 
 
-class LLM:
+class LLM(metaclass=SingletonMeta):
     """
     Wrapper class for Google's Gemini Language Model.
     
     Provides a simple interface to invoke the Gemini model with
     configured generation parameters for ATC decision-making.
     Includes automatic retry logic with configurable delays.
+    
+    Singleton: every LLM() call returns the same process-wide client,
+    so per-flight agents share one configured model wrapper.
     """
     
     # Retry configuration
     MAX_RETRIES = 3
-    RETRY_DELAY_SECONDS = 60  # 1 minute between retries
-    
+    MAX_RETRY_DELAY_SECONDS = 30  # backoff cap
+
+    @staticmethod
+    def _is_retryable(error: Exception) -> bool:
+        """
+        Whether an API error is worth retrying.
+
+        Rate limits (429) and server-side failures (5xx) are transient;
+        anything else client-side (bad request, auth, permission) will
+        fail the same way on every attempt, so retrying just burns time.
+        """
+        code = getattr(error, "code", None)
+        if isinstance(code, int):
+            return code == 429 or code >= 500
+        message = str(error)
+        return any(marker in message for marker in
+                   ("429", "500", "502", "503", "504",
+                    "ResourceExhausted", "InternalServerError",
+                    "ServiceUnavailable", "DeadlineExceeded"))
+
+
     def __init__(self):
         """Initialize the LLM wrapper."""
         self.model_name = 'gemini-2.5-flash'
+        # Build the model handle and generation config once; recreating
+        # them on every invoke re-validates the model name each call.
+        self._model = genai.GenerativeModel(self.model_name)
+        self._gen_config = genai.types.GenerationConfig(
+            temperature=0.1,  # Low temperature for consistent, deterministic outputs
+            top_p=0.95,
+        )
         print(f"[LLM] Initialized with model: {self.model_name}")
-        print(f"[LLM] Retry config: max_retries={self.MAX_RETRIES}, delay={self.RETRY_DELAY_SECONDS}s")
+        print(f"[LLM] Retry config: max_retries={self.MAX_RETRIES}, max delay={self.MAX_RETRY_DELAY_SECONDS}s")
+
+    @staticmethod
+    def _json_complete(text: str) -> bool:
+        """
+        Whether text already contains a complete top-level JSON object or
+        array. A brace/bracket depth scan (string-literal aware) is enough
+        here - it only decides when to stop streaming, the actual parse
+        happens downstream.
+        """
+        start_obj = text.find('{')
+        start_arr = text.find('[')
+        starts = [s for s in (start_obj, start_arr) if s != -1]
+        if not starts:
+            return False
+        depth = 0
+        in_string = False
+        escaped = False
+        for ch in text[min(starts):]:
+            if escaped:
+                escaped = False
+            elif ch == '\\' and in_string:
+                escaped = True
+            elif ch == '"':
+                in_string = not in_string
+            elif not in_string:
+                if ch in '{[':
+                    depth += 1
+                elif ch in '}]':
+                    depth -= 1
+                    if depth == 0:
+                        return True
+        return False
 
     def invoke(self, prompt: str) -> str:
         """
         Send a prompt to the Gemini model and get a response.
-        
-        Implements retry logic with 1-minute delay between attempts
-        in case of API failures or rate limiting.
-        
+
+        Streams the response and returns as soon as a complete top-level
+        JSON payload has arrived, instead of waiting for the model to
+        finish any trailing prose. Retries transient failures (rate
+        limits, server errors) with exponential backoff plus jitter;
+        non-retryable client errors fail fast without waiting out the
+        remaining attempts.
+
         Args:
             prompt: The text prompt to send to the model
-            
+
         Returns:
             The model's response text, or None if all retries failed
         """
         last_error = None
-        
+
         for attempt in range(1, self.MAX_RETRIES + 1):
             try:
                 print(f"[LLM] Invoking Gemini model (attempt {attempt}/{self.MAX_RETRIES})...")
-                model = genai.GenerativeModel(self.model_name)
-                
-                response = model.generate_content(
+                response = self._model.generate_content(
                     prompt,
-                    generation_config=genai.types.GenerationConfig(
-                        temperature=0.1,  # Low temperature for consistent, deterministic outputs
-                        top_p=0.95,
-                    )
+                    generation_config=self._gen_config,
+                    stream=True,
                 )
-                
+
+                parts = []
+                for chunk in response:
+                    if chunk.text:
+                        parts.append(chunk.text)
+                        if self._json_complete("".join(parts)):
+                            break
+                text = "".join(parts)
+
+                # Stopping early can cut off the closing ``` of a fenced
+                # block - restore it so downstream fence parsing still works
+                if "```json" in text and text.count("```") == 1:
+                    text += "\n```"
+
                 # Check if we got a valid response
-                if response and response.text:
-                    response_preview = response.text[:200] if len(response.text) > 200 else response.text
+                if text:
+                    response_preview = text[:200] if len(text) > 200 else text
                     print(f"[LLM] Response received: {response_preview}...")
-                    return response.text
+                    return text
                 else:
                     print(f"[LLM] WARNING: Empty response received on attempt {attempt}")
                     last_error = "Empty response from model"
@@ -66,11 +143,15 @@ class LLM:
             except Exception as e:
                 last_error = str(e)
                 print(f"[LLM] ERROR on attempt {attempt}: {e}")
-            
-            # If this wasn't the last attempt, wait before retrying
+                if not self._is_retryable(e):
+                    print("[LLM] FAILED: Non-retryable error, giving up.")
+                    return None
+
+            # If this wasn't the last attempt, back off before retrying
             if attempt < self.MAX_RETRIES:
-                print(f"[LLM] Waiting {self.RETRY_DELAY_SECONDS} seconds before retry...")
-                time.sleep(self.RETRY_DELAY_SECONDS)
+                delay = min(self.MAX_RETRY_DELAY_SECONDS, 2 ** attempt) + random.random()
+                print(f"[LLM] Waiting {delay:.1f} seconds before retry...")
+                time.sleep(delay)
         
         # All retries exhausted
         print(f"[LLM] FAILED: All {self.MAX_RETRIES} attempts exhausted. Last error: {last_error}")
@@ -7,15 +7,23 @@ class SingletonMeta(type):
     """
     Thread-safe Singleton metaclass.
     Any class using this metaclass will be a singleton per Python process.
+
+    The hot path (every access after the first) is a single dict.get with
+    no lock traffic - dict operations are atomic under the GIL, so the
+    lock only guards first construction. On free-threaded builds the same
+    structure stays correct because construction still happens under the
+    lock and publication is a single dict store.
     """
     _instances: Dict[type, object] = {}
     _lock: threading.Lock = threading.Lock()
 
     def __call__(cls, *args, **kwargs):
-        # Double-checked locking
-        if cls not in cls._instances:
-            with cls._lock:
-                if cls not in cls._instances:
-                    instance = super().__call__(*args, **kwargs)
-                    cls._instances[cls] = instance
-        return cls._instances[cls]
\ No newline at end of file
+        instance = cls._instances.get(cls)
+        if instance is not None:
+            return instance
+        with cls._lock:
+            instance = cls._instances.get(cls)
+            if instance is None:
+                instance = super().__call__(*args, **kwargs)
+                cls._instances[cls] = instance
+        return instance
@@ -1,7 +1,10 @@
 import requests
 
+from utils.singleton import SingletonMeta
 
-class WeatherInfo:
+
+class WeatherInfo(metaclass=SingletonMeta):
+    """Stateless NOAA weather client - shared as a process-wide singleton."""
     def __init__(self):
         pass
 
@@ -0,0 +1,340 @@
+"""
+Mock landing demo for the AI-ATC simulator.
+
+Walks a single arrival through the full landing sequence against a running
+simulator (uvicorn app.main:app on port 8000):
+
+    spawn -> DOWNWIND -> BASE -> FINAL -> clear to land -> touchdown
+
+The demo is async end-to-end: a single httpx.AsyncClient is shared across
+every poll and command (connection keep-alive, same as python_example.py),
+and the wait loops yield to the event loop with asyncio.sleep instead of
+blocking the thread.
+
+Where the simulator exposes the per-flight WebSocket stream
+(/api/ws/flights/{callsign}), the wait loops consume pushed snapshots
+instead of polling once a second; REST polling remains as a fallback.
+"""
+import asyncio
+import json
+import math
+
+import httpx
+import orjson
+import websockets
+
+BASE_URL = "http://localhost:8000/api"
+WS_BASE_URL = "ws://localhost:8000/api/ws"
+
+CLIENT_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+
+# Base REST poll interval (seconds); the actual delay adapts to how far the
+# aircraft is from the field and to the simulation speed multiplier
+POLL_INTERVAL = 1.0
+POLL_INTERVAL_MIN = 0.2
+POLL_INTERVAL_MAX = 2.0
+
+
+def _poll_delay(flight: dict, speed_multiplier: float = 1.0) -> float:
+    """Poll slowly while the flight is far out, quickly near the action."""
+    pos = flight["position"]
+    dist = math.hypot(pos["x"], pos["y"])
+    delay = (POLL_INTERVAL * dist / 20) / speed_multiplier
+    return min(max(delay, POLL_INTERVAL_MIN), POLL_INTERVAL_MAX)
+
+
+# Sentinel for "the simulator no longer knows this flight" (landed/departed
+# and cleaned up) - distinct from None, which means a transient fetch error
+GONE = object()
+
+# Grows on consecutive connection failures, resets on success
+_backoff = 0.5
+
+
+async def get_flight(client: httpx.AsyncClient, callsign: str):
+    """Fetch current data for a flight.
+
+    Returns the flight dict, GONE if the simulator reports 404, or None on
+    transient transport errors (after a short, growing backoff).
+    """
+    global _backoff
+    try:
+        response = await client.get(f"/flights/{callsign}")
+    except httpx.TransportError as exc:
+        print(f"  ! Simulator unreachable ({type(exc).__name__}) - "
+              f"retrying in {_backoff:.1f}s")
+        await asyncio.sleep(_backoff)
+        _backoff = min(_backoff * 2, 5.0)
+        return None
+    _backoff = 0.5
+    if response.status_code == 404:
+        return GONE
+    response.raise_for_status()
+    return response.json()
+
+
+# The demo's command bodies are fixed - serialize them once at import time
+# instead of allocating a dict and re-encoding JSON on every post
+JSON_HEADERS = {"Content-Type": "application/json"}
+DOWNWIND_CMD = orjson.dumps({"waypoint": "DOWNWIND", "altitude": 2000, "speed": 200})
+BASE_CMD = orjson.dumps({"waypoint": "BASE", "altitude": 1500, "speed": 160})
+FINAL_CMD = orjson.dumps({"waypoint": "FINAL", "altitude": 1000, "speed": 140})
+CLEAR_TO_LAND_CMD = orjson.dumps({"clear_to_land": True})
+
+
+async def send_command(client: httpx.AsyncClient, callsign: str, payload: bytes) -> dict:
+    """Send a pre-serialized ATC command and return the simulator's response."""
+    response = await client.post(f"/flights/{callsign}/command",
+                                 content=payload, headers=JSON_HEADERS)
+    return response.json()
+
+
+def print_flight_status(flight: dict) -> None:
+    """Print a one-line radar readout for a flight."""
+    # One lookup per field; hypot is a single C call vs two ** dispatches
+    pos = flight["position"]
+    x, y = pos["x"], pos["y"]
+    dist = math.hypot(x, y)
+    callsign = flight["callsign"]
+    status = flight["status"]
+    altitude = flight["altitude"]
+    speed = flight["speed"]
+    heading = flight["heading"]
+    passed = flight.get("passed_waypoints") or []
+    print(f"  {callsign}: {status} | "
+          f"alt {altitude:.0f}ft | spd {speed:.0f}kt | "
+          f"hdg {heading:.0f}° | dist {dist:.1f}nm | "
+          f"passed {passed}")
+
+
+async def _wait_for_waypoint_ws(callsign: str, waypoint: str) -> bool:
+    """Consume pushed flight snapshots until the waypoint has been passed."""
+    loop = asyncio.get_event_loop()
+    next_print = 0.0
+    async with websockets.connect(f"{WS_BASE_URL}/flights/{callsign}") as ws:
+        async for message in ws:
+            flight = json.loads(message)
+            if flight.get("removed"):
+                return False
+            # Single lookup per snapshot; () fallback avoids allocating a list
+            if waypoint in (flight.get("passed_waypoints") or ()):
+                print(f"  ✓ Passed {waypoint}")
+                return True
+            # Snapshots arrive every tick - throttle the readout to ~1/s
+            if loop.time() >= next_print:
+                print_flight_status(flight)
+                next_print = loop.time() + 1
+    return False
+
+
+async def wait_for_waypoint(client: httpx.AsyncClient, callsign: str,
+                            waypoint: str, timeout: float = 300,
+                            speed_multiplier: float = 1.0) -> bool:
+    """Wait until the flight has passed the given waypoint.
+
+    Prefers the per-flight WebSocket stream (one connection, pushed updates);
+    falls back to adaptive-interval REST polling if the stream is unavailable.
+    """
+    try:
+        return await asyncio.wait_for(
+            _wait_for_waypoint_ws(callsign, waypoint), timeout
+        )
+    except asyncio.TimeoutError:
+        print(f"  ✗ Timed out waiting for {waypoint}")
+        return False
+    except (OSError, websockets.WebSocketException):
+        print("  WebSocket unavailable - falling back to polling")
+
+    loop = asyncio.get_event_loop()
+    deadline = loop.time() + timeout
+    while loop.time() < deadline:
+        flight = await get_flight(client, callsign)
+        if flight is GONE:
+            print(f"  ✗ Flight left the simulation before reaching {waypoint}")
+            return False
+        if flight is None:
+            continue  # get_flight already backed off
+        if waypoint in (flight.get("passed_waypoints") or ()):
+            print(f"  ✓ Passed {waypoint}")
+            return True
+        print_flight_status(flight)
+        await asyncio.sleep(_poll_delay(flight, speed_multiplier))
+    print(f"  ✗ Timed out waiting for {waypoint}")
+    return False
+
+
+async def _request_clearance_ws(client: httpx.AsyncClient, callsign: str,
+                                rules: dict) -> bool:
+    """Fire the clearance request the moment the landing rules are satisfied.
+
+    Watches the pushed snapshots and only posts clear_to_land when altitude,
+    speed, distance and required waypoint are all within limits - no blind
+    retry every 2 seconds.
+    """
+    max_alt = rules["max_altitude"]
+    min_spd = rules["min_speed"]
+    max_spd = rules["max_speed"]
+    max_dist = rules["max_distance"]
+    required = rules["required_waypoint"]
+    async with websockets.connect(f"{WS_BASE_URL}/flights/{callsign}") as ws:
+        async for message in ws:
+            flight = json.loads(message)
+            if flight.get("removed"):
+                return False
+            pos = flight["position"]
+            if (flight["altitude"] <= max_alt
+                    and min_spd <= flight["speed"] <= max_spd
+                    and math.hypot(pos["x"], pos["y"]) <= max_dist
+                    and required in (flight.get("passed_waypoints") or ())):
+                result = await send_command(client, callsign, CLEAR_TO_LAND_CMD)
+                if result["status"] == "ok":
+                    print("  ✓ Cleared to land runway 34")
+                    return True
+                # Rules look satisfied but the tower still refused - brief
+                # pause so denials don't fire at tick rate
+                print(f"  Clearance denied: {result['result']['message']}")
+                await asyncio.sleep(0.5)
+    return False
+
+
+async def request_landing_clearance(client: httpx.AsyncClient, callsign: str,
+                                    timeout: float = 120) -> bool:
+    """Obtain landing clearance, preferring the event-driven WebSocket path."""
+    rules = (await client.get("/landing-rules")).json()
+    try:
+        return await asyncio.wait_for(
+            _request_clearance_ws(client, callsign, rules), timeout
+        )
+    except asyncio.TimeoutError:
+        print("  ✗ Timed out waiting for clearance conditions")
+        return False
+    except (OSError, websockets.WebSocketException):
+        print("  WebSocket unavailable - falling back to retry loop")
+
+    # Fallback: keep-alive makes each attempt near-free, so retry quickly
+    for attempt in range(1, 11):
+        result = await send_command(client, callsign, CLEAR_TO_LAND_CMD)
+        if result["status"] == "ok":
+            print(f"  ✓ Cleared to land runway 34 (attempt {attempt})")
+            return True
+        print(f"  Attempt {attempt}: {result['result']['message']}")
+        await asyncio.sleep(0.5)
+    return False
+
+
+# All 21 possible progress bars, built once instead of two string
+# multiplications plus a concatenation per monitor iteration
+BARS = tuple("█" * i + "░" * (20 - i) for i in range(21))
+
+
+def _print_landing_bar(flight: dict) -> None:
+    """Render the touchdown progress bar for one snapshot."""
+    pos = flight["position"]
+    dist = math.hypot(pos["x"], pos["y"])
+    bar = BARS[min(20, int((1 - min(dist / 15, 1)) * 20))]
+    print(f"\r  [{bar}] {dist:5.1f}nm | alt {flight['altitude']:5.0f}ft | "
+          f"spd {flight['speed']:3.0f}kt", end="", flush=True)
+
+
+async def _monitor_landing_ws(callsign: str) -> None:
+    """Follow the landing via pushed snapshots until touchdown."""
+    async with websockets.connect(f"{WS_BASE_URL}/flights/{callsign}") as ws:
+        async for message in ws:
+            flight = json.loads(message)
+            if flight.get("removed") or flight.get("status") == "landed":
+                print("\n  ✓ Touchdown - flight landed")
+                return
+            _print_landing_bar(flight)
+
+
+async def monitor_landing(client: httpx.AsyncClient, callsign: str,
+                          timeout: float = 300,
+                          speed_multiplier: float = 1.0) -> None:
+    """Track the flight down to the runway, WebSocket first, polling fallback."""
+    try:
+        await asyncio.wait_for(_monitor_landing_ws(callsign), timeout)
+        return
+    except asyncio.TimeoutError:
+        print("\n  ✗ Timed out waiting for touchdown")
+        return
+    except (OSError, websockets.WebSocketException):
+        print("  WebSocket unavailable - falling back to polling")
+
+    loop = asyncio.get_event_loop()
+    deadline = loop.time() + timeout
+    while loop.time() < deadline:
+        flight = await get_flight(client, callsign)
+        if flight is None:
+            continue  # transient error - get_flight already backed off
+        if flight is GONE or flight["status"] == "landed":
+            print("\n  ✓ Touchdown - flight landed")
+            return
+        _print_landing_bar(flight)
+        await asyncio.sleep(_poll_delay(flight, speed_multiplier))
+    print("\n  ✗ Timed out waiting for touchdown")
+
+
+async def main() -> None:
+    print("=" * 60)
+    print("  AI-ATC MOCK LANDING DEMO")
+    print("=" * 60)
+
+    async with httpx.AsyncClient(base_url=BASE_URL, limits=CLIENT_LIMITS,
+                                 timeout=5.0) as client:
+        # Step 1: Check the simulator is reachable
+        print("\n[1] Checking simulator status...")
+        status = (await client.get("/simulation/status")).json()
+        print(f"  Running: {status['running']} | active flights: {status['total_flights']}")
+        speed_multiplier = status.get("speed_multiplier", 1.0)
+
+        # Step 2: Spawn a fresh arrival to control
+        print("\n[2] Spawning arrival...")
+        spawn = (await client.post("/simulation/spawn/arrival")).json()
+        if spawn["status"] != "ok":
+            print(f"  Spawn failed: {spawn.get('message')}")
+            return
+        callsign = spawn["flight"]["callsign"]
+        print(f"  Radar contact: {callsign}")
+
+        # Step 3: Initial picture
+        print("\n[3] Initial flight state:")
+        flight = await get_flight(client, callsign)
+        if flight is not None and flight is not GONE:
+            print_flight_status(flight)
+
+        # Step 4: Vector to DOWNWIND
+        print("\n[4] Vectoring to DOWNWIND (2000ft, 200kt)...")
+        await send_command(client, callsign, DOWNWIND_CMD)
+        if not await wait_for_waypoint(client, callsign, "DOWNWIND",
+                                       speed_multiplier=speed_multiplier):
+            return
+
+        # Step 5: Turn BASE
+        print("\n[5] Turning BASE (1500ft, 160kt)...")
+        await send_command(client, callsign, BASE_CMD)
+        if not await wait_for_waypoint(client, callsign, "BASE",
+                                       speed_multiplier=speed_multiplier):
+            return
+
+        # Step 6: Turn FINAL
+        print("\n[6] Turning FINAL (1000ft, 140kt)...")
+        await send_command(client, callsign, FINAL_CMD)
+        if not await wait_for_waypoint(client, callsign, "FINAL",
+                                       speed_multiplier=speed_multiplier):
+            return
+
+        # Step 7: Request landing clearance when the rules are satisfied
+        print("\n[7] Requesting landing clearance...")
+        if not await request_landing_clearance(client, callsign):
+            print("  ✗ Could not obtain landing clearance")
+            return
+
+        # Step 8: Monitor the landing
+        print("\n[8] Monitoring landing...")
+        await monitor_landing(client, callsign, speed_multiplier=speed_multiplier)
+
+    print("\n\nDemo complete.")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,110 @@
+"""
+API tour for the AI-ATC simulator.
+
+Exercises every read endpoint and the basic command flow against a running
+simulator (uvicorn app.main:app on port 8000). Uses a single
+httpx.AsyncClient for connection reuse; independent GETs are batched with
+asyncio.gather so total wall time is the slowest response rather than the
+sum of all of them. The command-issuing section stays sequential because
+each step depends on the previous one.
+"""
+import asyncio
+
+import httpx
+
+BASE_URL = "http://localhost:8000/api"
+
+CLIENT_LIMITS = httpx.Limits(max_keepalive_connections=10, max_connections=100)
+
+# /airport, /waypoints and /landing-rules are static for the whole session -
+# remember their payloads so repeat fetches skip the round trip entirely.
+_static_cache: dict = {}
+
+
+async def cached_get(client: httpx.AsyncClient, path: str):
+    """GET a static endpoint, serving repeats from the in-memory cache."""
+    if path not in _static_cache:
+        _static_cache[path] = (await client.get(path)).json()
+    return _static_cache[path]
+
+
+async def main() -> None:
+    print("=" * 60)
+    print("  AI-ATC API EXAMPLE")
+    print("=" * 60)
+
+    async with httpx.AsyncClient(base_url=BASE_URL, limits=CLIENT_LIMITS,
+                                 timeout=5.0) as client:
+        # These endpoints are independent of each other - fetch them
+        # concurrently over the pooled connections.
+        (airport, waypoints, rules, status_r,
+         flights_r, landing_r, takeoff_r) = await asyncio.gather(
+            cached_get(client, "/airport"),
+            cached_get(client, "/waypoints"),
+            cached_get(client, "/landing-rules"),
+            client.get("/simulation/status"),
+            client.get("/flights"),
+            client.get("/flights/landing"),
+            client.get("/flights/takeoff"),
+        )
+
+        print(f"\nAirport: {airport['icao']} ({airport['name']}), "
+              f"runway {airport['runway']} heading {airport['runway_heading']}°")
+
+        print(f"Waypoints: {', '.join(sorted(waypoints))}")
+
+        print(f"Landing rules: max alt {rules['max_altitude']}ft, "
+              f"speed {rules['min_speed']}-{rules['max_speed']}kt, "
+              f"within {rules['max_distance']}nm, "
+              f"must pass {rules['required_waypoint']}")
+
+        status = status_r.json()
+        print(f"Simulation: running={status['running']}, "
+              f"{status['total_flights']} flights "
+              f"({status['arrivals']} arrivals / {status['departures']} departures)")
+
+        print(f"Active flights: {len(flights_r.json())}")
+        print(f"Landing flights: {len(landing_r.json())}")
+        print(f"Takeoff flights: {len(takeoff_r.json())}")
+
+        # Spawn an arrival and walk it through a couple of commands.
+        # These calls are causally ordered - keep them sequential.
+        print("\nSpawning an arrival...")
+        spawn = (await client.post("/simulation/spawn/arrival")).json()
+        if spawn["status"] != "ok":
+            print(f"Spawn failed: {spawn.get('message')}")
+            return
+        callsign = spawn["flight"]["callsign"]
+        print(f"Radar contact: {callsign}")
+
+        flight = (await client.get(f"/flights/{callsign}")).json()
+        print(f"{callsign}: {flight['status']} at {flight['altitude']:.0f}ft")
+
+        print(f"Vectoring {callsign} to DOWNWIND...")
+        command = (await client.post(
+            f"/flights/{callsign}/command",
+            json={"waypoint": "DOWNWIND", "altitude": 2000, "speed": 200},
+        )).json()
+        print(f"Command result: {command['result']['message']}")
+
+        await asyncio.sleep(2)
+
+        # Independent follow-up reads - batch them as well.
+        flight_r, near_misses_r, history_r = await asyncio.gather(
+            client.get(f"/flights/{callsign}"),
+            client.get("/simulation/near-misses"),
+            client.get("/flights/history"),
+        )
+        flight = flight_r.json()
+        print(f"\n{callsign} now heading {flight['heading']:.0f}° "
+              f"towards {flight['target_waypoint']}")
+        print(f"Active near misses: {len(near_misses_r.json())}")
+        history = history_r.json()
+        print(f"History: {len(history['landed'])} landed, "
+              f"{len(history['departed'])} departed")
+
+    print("\nExample complete.")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
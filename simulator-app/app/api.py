@@ -1,8 +1,17 @@
 """FastAPI REST API endpoints for the ATC simulator."""
-from fastapi import APIRouter, HTTPException
+import dataclasses
+import hashlib
+from pathlib import Path
+
+import orjson
+from fastapi import (
+    APIRouter, HTTPException, Request, Response, WebSocket, WebSocketDisconnect
+)
 from pydantic import BaseModel
 from typing import Optional, Any
-from .models import FlightData, FlightCommand, AirportData, LandingRules, Waypoint
+from .models import (
+    FlightData, FlightCommand, FlightType, AirportData, LandingRules, Waypoint
+)
 from .simulation import simulator
 
 router = APIRouter(prefix="/api", tags=["flights"])
@@ -10,6 +19,24 @@ router = APIRouter(prefix="/api", tags=["flights"])
 # Callback for broadcasting ATC messages (set by main.py)
 atc_message_callback = None
 
+# Airport, waypoints and landing rules never change during a session:
+# encode each body once, tag it with an ETag, and answer If-None-Match
+# revalidations with an empty 304 instead of re-sending the JSON.
+STATIC_CACHE_CONTROL = "public, max-age=3600"
+_static_bodies: dict[str, tuple[bytes, str]] = {}
+
+
+def _static_response(key: str, request: Request, build) -> Response:
+    """Serve a precomputed static JSON body, honouring If-None-Match."""
+    if key not in _static_bodies:
+        body = orjson.dumps(build())
+        _static_bodies[key] = (body, hashlib.sha1(body).hexdigest())
+    body, etag = _static_bodies[key]
+    headers = {"ETag": etag, "Cache-Control": STATIC_CACHE_CONTROL}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
 
 class SpeedRequest(BaseModel):
     multiplier: float
@@ -22,49 +49,77 @@ class ATCMessageRequest(BaseModel):
     source: str = "AI_AGENT"
 
 
-@router.get("/airport", response_model=AirportData)
-async def get_airport():
-    """Get airport information."""
-    airport = simulator.get_airport()
-    return AirportData(
-        icao=airport["icao"],
-        name=airport["name"],
-        elevation=airport["elevation"],
-        runway=airport["runway"],
-        runway_heading=airport["runway_heading"],
-        runway_length=airport["runway_length"],
+@router.get("/airport")
+async def get_airport(request: Request):
+    """Get airport information (static - precomputed body, ETag-aware)."""
+    return _static_response(
+        "airport", request,
+        lambda: AirportData(**simulator.get_airport()).model_dump(),
+    )
+
+
+@router.get("/waypoints")
+async def get_waypoints(request: Request):
+    """Get all navigation waypoints (static - precomputed body, ETag-aware)."""
+    return _static_response(
+        "waypoints", request,
+        lambda: {name: dataclasses.asdict(wp)
+                 for name, wp in simulator.get_waypoints().items()},
     )
 
 
-@router.get("/waypoints", response_model=dict[str, Waypoint])
-async def get_waypoints():
-    """Get all navigation waypoints."""
-    return simulator.get_waypoints()
+@router.get("/landing-rules")
+async def get_landing_rules(request: Request):
+    """Get rules for landing clearance (static - precomputed body, ETag-aware)."""
+    return _static_response(
+        "landing-rules", request,
+        lambda: LandingRules(**simulator.get_landing_rules()).model_dump(),
+    )
 
 
-@router.get("/landing-rules", response_model=LandingRules)
-async def get_landing_rules():
-    """Get rules for landing clearance."""
-    rules = simulator.get_landing_rules()
-    return LandingRules(**rules)
+# The flight-list endpoints skip response_model validation: the simulator
+# already builds well-typed FlightData, so a second pydantic pass per flight
+# per poll is pure overhead. Dump once and hand the dicts to the encoder.
 
+@router.get("/flights", response_model=None)
+async def get_all_flights(request: Request):
+    """Get all flights currently in the simulation.
 
-@router.get("/flights", response_model=list[FlightData])
-async def get_all_flights():
-    """Get all flights currently in the simulation."""
-    return simulator.get_all_flights()
+    The body is dynamic but often identical between polls (e.g. while the
+    simulation is paused), so it carries a content-hash ETag and honours
+    If-None-Match with an empty 304.
+    """
+    body = orjson.dumps([f.model_dump() for f in simulator.get_all_flights()],
+                        option=orjson.OPT_SERIALIZE_NUMPY)
+    etag = hashlib.sha1(body).hexdigest()
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json",
+                    headers={"ETag": etag})
 
 
-@router.get("/flights/landing", response_model=list[FlightData])
+@router.get("/flights/landing", response_model=None)
 async def get_landing_flights():
     """Get flights that are currently approaching for landing."""
-    return simulator.get_landing_flights()
+    return [f.model_dump() for f in simulator.get_landing_flights()]
 
 
-@router.get("/flights/takeoff", response_model=list[FlightData])
+@router.get("/flights/takeoff", response_model=None)
 async def get_takeoff_flights():
     """Get flights that are ready for takeoff."""
-    return simulator.get_takeoff_flights()
+    return [f.model_dump() for f in simulator.get_takeoff_flights()]
+
+
+# Registered before /flights/{callsign}, which would otherwise capture
+# "history" as a callsign and 404
+@router.get("/flights/history")
+async def get_flight_history():
+    """
+    Get history of completed flights (landed and departed).
+
+    Returns the last 50 landed and last 50 departed flights.
+    """
+    return simulator.get_flight_history()
 
 
 @router.get("/flights/{callsign}", response_model=FlightData)
@@ -76,6 +131,30 @@ async def get_flight(callsign: str):
     return flight.to_data()
 
 
+@router.websocket("/ws/flights/{callsign}")
+async def flight_updates(websocket: WebSocket, callsign: str):
+    """
+    Push per-tick snapshots for a single flight over WebSocket.
+
+    Sends the full flight state every simulation tick, then a final
+    {"callsign": ..., "removed": true} message when the flight leaves the
+    simulation. Lets clients wait on waypoint passage or landing without
+    polling the REST endpoints.
+    """
+    await websocket.accept()
+    queue = simulator.subscribe_flight(callsign)
+    try:
+        while True:
+            snapshot = await queue.get()
+            await websocket.send_json(snapshot)
+            if snapshot.get("removed"):
+                break
+    except WebSocketDisconnect:
+        pass
+    finally:
+        simulator.unsubscribe_flight(callsign, queue)
+
+
 @router.post("/flights/{callsign}/command")
 async def command_flight(callsign: str, command: FlightCommand):
     """Issue a command to a specific flight."""
@@ -118,25 +197,39 @@ async def spawn_departure():
     return {"status": "ok", "flight": flight.to_data()}
 
 
+# Constant key tuple for the status payload - the dict is rebuilt on every
+# poll, so zip against this instead of re-hashing a 12-key dict literal
+SIM_STATUS_KEYS = (
+    "running", "failed", "failure_reason", "collision_pair", "total_flights",
+    "arrivals", "departures", "landed", "departed", "near_misses",
+    "speed_multiplier", "session_duration",
+)
+
+
 @router.get("/simulation/status")
 async def get_simulation_status():
     """Get current simulation status and statistics."""
-    flights = simulator.get_all_flights()
     stats = simulator.get_stats()
-    return {
-        "running": simulator.running,
-        "failed": stats["failed"],
-        "failure_reason": stats["failure_reason"],
-        "collision_pair": stats["collision_pair"],
-        "total_flights": len(flights),
-        "arrivals": len([f for f in flights if f.flight_type.value == "arrival"]),
-        "departures": len([f for f in flights if f.flight_type.value == "departure"]),
-        "landed": stats["landed"],
-        "departed": stats["departed"],
-        "near_misses": stats["near_misses"],
-        "speed_multiplier": stats["speed_multiplier"],
-        "session_duration": stats["session_duration"],
-    }
+    stats_get = stats.__getitem__
+
+    # Counts come from the simulator's SoA snapshot - no FlightData models
+    # are materialized just to be counted
+    arrivals, departures = simulator.count_flight_types()
+
+    return dict(zip(SIM_STATUS_KEYS, (
+        simulator.running,
+        stats_get("failed"),
+        stats_get("failure_reason"),
+        stats_get("collision_pair"),
+        arrivals + departures,
+        arrivals,
+        departures,
+        stats_get("landed"),
+        stats_get("departed"),
+        stats_get("near_misses"),
+        stats_get("speed_multiplier"),
+        stats_get("session_duration"),
+    )))
 
 
 @router.get("/simulation/stats")
@@ -173,26 +266,22 @@ async def end_simulation():
     return {"status": "ok", "saved_score": score}
 
 
+# Parsed scores.json, keyed by file mtime so the disk read and JSON parse
+# only happen when the file has actually changed
+_scores_cache = {"mtime": 0.0, "data": []}
+
+
 @router.get("/scores")
 async def get_scores():
     """Get saved scores history."""
-    import json
-    from pathlib import Path
     scores_file = Path(__file__).parent.parent / "scores.json"
-    if scores_file.exists():
-        with open(scores_file, 'r') as f:
-            return json.load(f)
-    return []
-
-
-@router.get("/flights/history")
-async def get_flight_history():
-    """
-    Get history of completed flights (landed and departed).
-    
-    Returns the last 50 landed and last 50 departed flights.
-    """
-    return simulator.get_flight_history()
+    if not scores_file.exists():
+        return []
+    mtime = scores_file.stat().st_mtime
+    if mtime != _scores_cache["mtime"]:
+        _scores_cache["data"] = orjson.loads(scores_file.read_bytes())
+        _scores_cache["mtime"] = mtime
+    return _scores_cache["data"]
 
 
 @router.post("/atc/broadcast")
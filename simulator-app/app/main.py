@@ -3,8 +3,9 @@ import asyncio
 import json
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse
 from pathlib import Path
 
 from . import api
@@ -43,11 +44,15 @@ manager = ConnectionManager()
 
 
 async def broadcast_updates(flights, stats, near_misses, history):
-    """Callback to broadcast flight updates to WebSocket clients."""
+    """Callback to broadcast flight updates to WebSocket clients.
+
+    `flights` arrives as the simulator's per-tick list of dumped dicts, so
+    no per-connection re-serialization of models happens here.
+    """
     if manager.active_connections:
         await manager.broadcast({
             "type": "update",
-            "flights": [f.model_dump() for f in flights],
+            "flights": flights,
             "stats": stats,
             "near_misses": near_misses,
             "history": history,
@@ -85,8 +90,17 @@ app = FastAPI(
     description="An online Air Traffic Control simulator with API for AI agents",
     version="2.0.0",
     lifespan=lifespan,
+    # orjson encodes the flight-list payloads several times faster than
+    # stdlib json - these endpoints are polled continuously by clients
+    default_response_class=ORJSONResponse,
 )
 
+# Flight-list and waypoint payloads are a few KB of JSON with heavily
+# repeated keys - gzip shrinks them to a fraction on the wire for polling
+# clients. Small bodies (and the empty 304 revalidations) pass through
+# uncompressed, and the middleware emits Vary: Accept-Encoding.
+app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=5)
+
 app.include_router(api_router)
 
 static_dir = Path(__file__).parent.parent / "static"
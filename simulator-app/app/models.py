@@ -2,6 +2,7 @@
 from enum import Enum
 from typing import Optional
 from pydantic import BaseModel, Field
+from pydantic.dataclasses import dataclass
 
 
 class FlightStatus(str, Enum):
@@ -25,13 +26,19 @@ class FlightType(str, Enum):
     DEPARTURE = "departure"
 
 
-class Position(BaseModel):
-    """Geographic position."""
+# Position and Waypoint are created for every flight on every flight-list
+# response; slotted dataclasses skip the per-instance __dict__ and the
+# BaseModel construction machinery on this hot path.
+
+@dataclass(slots=True)
+class Position:
+    """Geographic position (mutable - updated every simulation tick)."""
     x: float = Field(..., description="X position in nautical miles from airport")
     y: float = Field(..., description="Y position in nautical miles from airport")
 
 
-class Waypoint(BaseModel):
+@dataclass(slots=True, frozen=True)
+class Waypoint:
     """Navigation waypoint."""
     name: str = Field(..., description="Waypoint identifier")
     position: Position = Field(..., description="Waypoint position")
@@ -1,27 +1,49 @@
 """Flight simulation engine with physics."""
-import math
 import random
 import asyncio
+import time
 import json
+from collections import deque
+import numpy as np
+# Bound once at import so the hot paths skip the math-module attribute lookup
+from math import atan2, cos, degrees, pi, sin, sqrt
 from datetime import datetime
-from typing import Optional
+from typing import NamedTuple, Optional
 from pathlib import Path
 from .models import (
     FlightData, FlightStatus, FlightType, Position, FlightCommand, Waypoint
 )
 
 
+class AircraftCharacteristics(NamedTuple):
+    """Performance numbers for an aircraft type (immutable, attribute access)."""
+    cruise_speed: float
+    approach_speed: float
+    min_approach_speed: float
+    max_approach_speed: float
+    climb_rate: float
+    descent_rate: float
+
+
 # Aircraft types with characteristics
 AIRCRAFT_TYPES = {
-    "B738": {"cruise_speed": 450, "approach_speed": 140, "min_approach_speed": 130, "max_approach_speed": 160, "climb_rate": 2500, "descent_rate": 1500},
-    "A320": {"cruise_speed": 450, "approach_speed": 137, "min_approach_speed": 125, "max_approach_speed": 155, "climb_rate": 2400, "descent_rate": 1400},
-    "B77W": {"cruise_speed": 490, "approach_speed": 150, "min_approach_speed": 140, "max_approach_speed": 170, "climb_rate": 2000, "descent_rate": 1200},
-    "A359": {"cruise_speed": 480, "approach_speed": 145, "min_approach_speed": 135, "max_approach_speed": 165, "climb_rate": 2200, "descent_rate": 1300},
-    "E190": {"cruise_speed": 430, "approach_speed": 130, "min_approach_speed": 120, "max_approach_speed": 150, "climb_rate": 2800, "descent_rate": 1600},
-    "C172": {"cruise_speed": 120, "approach_speed": 65, "min_approach_speed": 55, "max_approach_speed": 80, "climb_rate": 700, "descent_rate": 500},
+    "B738": AircraftCharacteristics(450, 140, 130, 160, 2500, 1500),
+    "A320": AircraftCharacteristics(450, 137, 125, 155, 2400, 1400),
+    "B77W": AircraftCharacteristics(490, 150, 140, 170, 2000, 1200),
+    "A359": AircraftCharacteristics(480, 145, 135, 165, 2200, 1300),
+    "E190": AircraftCharacteristics(430, 130, 120, 150, 2800, 1600),
+    "C172": AircraftCharacteristics(120, 65, 55, 80, 700, 500),
 }
 
-AIRLINES = ["UAL", "DAL", "AAL", "SWA", "JBU", "ASA", "FFT", "SKW"]
+AIRLINES = ("UAL", "DAL", "AAL", "SWA", "JBU", "ASA", "FFT", "SKW")
+
+# Spawn-time choice pools as tuples built once - random.choice accepts them
+# directly, with no list(...) rebuild per spawn
+_AIRCRAFT_KEYS = tuple(AIRCRAFT_TYPES)
+_AIRPORTS = ("KSEA", "KPDX", "KBFI", "KPAE", "KOLM")
+
+# Integer codes for the SoA flight-type array
+TYPE_CODES = {FlightType.ARRIVAL: 0, FlightType.DEPARTURE: 1}
 
 # Airport configuration - Renton style single runway
 AIRPORT = {
@@ -129,6 +151,19 @@ WAYPOINTS: dict[str, Waypoint] = {
     ),
 }
 
+# Waypoint coordinates as parallel arrays: the per-tick passage check is one
+# broadcasted (flights x waypoints) distance computation instead of a Python
+# dict walk per flight
+_WP_NAMES = tuple(WAYPOINTS)
+_WP_X = np.array([w.position.x for w in WAYPOINTS.values()])
+_WP_Y = np.array([w.position.y for w in WAYPOINTS.values()])
+
+# One bit per waypoint: "has this flight passed X" becomes a mask test
+# instead of a linear scan of the passed_waypoints list every tick
+_WP_BIT = {name: 1 << i for i, name in enumerate(WAYPOINTS)}
+_FINAL_BIT = _WP_BIT["FINAL"]
+_NORTH_BIT = _WP_BIT["NORTH"]
+
 # Landing rules
 LANDING_RULES = {
     "max_altitude": 1500,
@@ -145,10 +180,119 @@ NEAR_MISS_ALTITUDE = 1000        # 1000ft vertical for near miss
 COLLISION_DISTANCE_NM = 0.15     # ~900ft horizontal - collision
 COLLISION_ALTITUDE = 500         # 500ft vertical for collision
 
+# Squared radii for the hot-path comparisons - comparing dx*dx+dy*dy against
+# these skips the sqrt; the real distance is only computed when a message
+# needs the number
+WAYPOINT_PASS_R2 = 0.5 ** 2
+NEAR_MISS_R2 = NEAR_MISS_DISTANCE_NM ** 2
+COLLISION_R2 = COLLISION_DISTANCE_NM ** 2
+
+# Below this many airborne flights the all-pairs numpy distance matrix is
+# cheaper than building the spatial grid
+DENSE_SEPARATION_LIMIT = 64
+
+# Status groups for the hot membership tests (frozenset hash lookup instead
+# of a linear scan over a list rebuilt per call)
+GROUND_STATUSES = frozenset({
+    FlightStatus.LANDED,
+    FlightStatus.AT_GATE,
+    FlightStatus.READY_FOR_TAKEOFF,
+    FlightStatus.TAXIING_TO_GATE,
+    FlightStatus.TAXIING_TO_RUNWAY,
+})
+AIRBORNE_STATUSES = frozenset({
+    FlightStatus.APPROACHING,
+    FlightStatus.ON_FINAL,
+    FlightStatus.LANDING,
+    FlightStatus.TAKING_OFF,
+    FlightStatus.DEPARTING,
+})
+LANDING_STATUSES = frozenset({
+    FlightStatus.APPROACHING,
+    FlightStatus.ON_FINAL,
+    FlightStatus.LANDING,
+})
+TAKEOFF_STATUSES = frozenset({
+    FlightStatus.READY_FOR_TAKEOFF,
+    FlightStatus.TAKING_OFF,
+})
+
+# Physics runs faster than the UI needs updates: integrate at 50 Hz for
+# smoother/more stable motion, but serialize and broadcast only every 5th
+# tick (10 Hz, the old rate)
+PHYSICS_INTERVAL = 0.02
+BROADCAST_EVERY = 5
+
+
+try:
+    # Optional JIT: numba compiles the kernel loop to one fused machine-code
+    # pass with no temporary arrays. Honors NUMBA_DISABLE_JIT for debugging;
+    # cache=True keeps the compiled artifact across runs.
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _kinematics_kernel(x, y, alt, spd, hdg, tgt_alt, tgt_spd, tgt_hdg,
+                       climb, descent, dt: float) -> None:
+    """Advance one tick of flight kinematics, mutating the arrays in place.
+
+    Mirrors the per-flight scalar rules: climb/descend at the aircraft's
+    rate while more than 10 ft from the target altitude, accelerate at
+    5 kt/s toward the target speed, turn at 3 deg/s along the shortest
+    arc, then integrate position from the updated speed and heading.
+
+    Written as an explicit loop so numba can fuse and autovectorize it;
+    without numba it still runs as plain Python over the arrays.
+    """
+    dt60 = dt / 60.0
+    dt3600 = dt / 3600.0
+    deg2rad = pi / 180.0
+    for i in range(x.shape[0]):
+        alt_diff = tgt_alt[i] - alt[i]
+        if alt_diff > 10.0:
+            alt[i] += climb[i] * dt60
+        elif alt_diff < -10.0:
+            alt[i] = max(alt[i] - descent[i] * dt60, 0.0)
+
+        spd_diff = tgt_spd[i] - spd[i]
+        if spd_diff > 1.0:
+            spd[i] += min(spd_diff, 5.0 * dt)
+        elif spd_diff < -1.0:
+            spd[i] += max(spd_diff, -5.0 * dt)
+
+        hdg_diff = (tgt_hdg[i] - hdg[i] + 540.0) % 360.0 - 180.0
+        if hdg_diff > 0.5:
+            hdg[i] = (hdg[i] + min(hdg_diff, 3.0 * dt)) % 360.0
+        elif hdg_diff < -0.5:
+            hdg[i] = (hdg[i] + max(hdg_diff, -3.0 * dt)) % 360.0
+
+        dist = spd[i] * dt3600
+        hdg_rad = hdg[i] * deg2rad
+        x[i] += dist * sin(hdg_rad)
+        y[i] += dist * cos(hdg_rad)
+
+
+if njit is not None:
+    _kinematics_kernel = njit(cache=True, fastmath=True)(_kinematics_kernel)
+
 
 class Flight:
     """Represents a single flight with physics simulation."""
-    
+
+    # No per-instance __dict__: fixed-offset attribute access and a much
+    # smaller footprint for the hot-loop attribute traffic
+    __slots__ = (
+        'callsign', 'flight_type', 'aircraft_type', 'position', 'altitude',
+        'speed', 'heading', 'origin', 'destination', 'target_altitude',
+        'target_speed', 'target_heading', 'target_waypoint', '_target_wp_pos',
+        'status',
+        'cleared_to_land', 'cleared_for_takeoff', 'passed_waypoints',
+        '_passed_bits', 'current_waypoint', 'characteristics', '_climb_rate', '_descent_rate',
+        '_approach_speed', 'created_at', 'gate_time', 'completed_at',
+        'clearance_denial_reason',
+    )
+
     def __init__(self, callsign: str, flight_type: FlightType, aircraft_type: str,
                  position: Position, altitude: float, speed: float, heading: float,
                  origin: Optional[str] = None, destination: Optional[str] = None):
@@ -166,16 +310,23 @@ class Flight:
         self.target_speed = speed
         self.target_heading = heading
         self.target_waypoint: Optional[str] = None
+        self._target_wp_pos: Optional[tuple[float, float]] = None
         
-        self.status = (FlightStatus.APPROACHING if flight_type == FlightType.ARRIVAL 
+        self.status = (FlightStatus.APPROACHING if flight_type is FlightType.ARRIVAL
                       else FlightStatus.AT_GATE)
         self.cleared_to_land = False
         self.cleared_for_takeoff = False
         
         self.passed_waypoints: list[str] = []
+        self._passed_bits = 0
         self.current_waypoint: Optional[str] = None
         
         self.characteristics = AIRCRAFT_TYPES.get(aircraft_type, AIRCRAFT_TYPES["B738"])
+        # Hoisted from the characteristics tuple so the hot paths read bare
+        # attributes instead of doing a lookup per tick
+        self._climb_rate = self.characteristics.climb_rate
+        self._descent_rate = self.characteristics.descent_rate
+        self._approach_speed = self.characteristics.approach_speed
         
         self.created_at = datetime.now()
         self.gate_time = 0
@@ -185,23 +336,11 @@ class Flight:
     
     def is_on_ground(self) -> bool:
         """Check if flight is on the ground."""
-        return self.status in [
-            FlightStatus.LANDED, 
-            FlightStatus.AT_GATE, 
-            FlightStatus.READY_FOR_TAKEOFF,
-            FlightStatus.TAXIING_TO_GATE,
-            FlightStatus.TAXIING_TO_RUNWAY
-        ]
+        return self.status in GROUND_STATUSES
     
     def is_airborne_active(self) -> bool:
         """Check if flight is airborne and should be checked for separation."""
-        return self.status in [
-            FlightStatus.APPROACHING,
-            FlightStatus.ON_FINAL,
-            FlightStatus.LANDING,
-            FlightStatus.TAKING_OFF,
-            FlightStatus.DEPARTING,
-        ]
+        return self.status in AIRBORNE_STATUSES
     
     def apply_command(self, command: FlightCommand) -> dict:
         """Apply an ATC command to the flight."""
@@ -213,10 +352,10 @@ class Flight:
             self.target_speed = command.speed
         if command.heading is not None:
             self.target_heading = command.heading % 360
-            self.target_waypoint = None  # Clear waypoint when given direct heading
+            self._set_target_waypoint(None)  # Clear waypoint when given direct heading
         if command.waypoint is not None:
             if command.waypoint in WAYPOINTS:
-                self.target_waypoint = command.waypoint
+                self._set_target_waypoint(command.waypoint)
                 self.current_waypoint = command.waypoint
             else:
                 result = {"success": False, "message": f"Unknown waypoint: {command.waypoint}"}
@@ -228,10 +367,10 @@ class Flight:
                 if can_clear:
                     self.cleared_to_land = True
                     self.clearance_denial_reason = None
-                    self.target_waypoint = "RUNWAY"
+                    self._set_target_waypoint("RUNWAY")
                     self.current_waypoint = "RUNWAY"
                     self.target_altitude = AIRPORT["elevation"]
-                    self.target_speed = self.characteristics.get("approach_speed", 140)
+                    self.target_speed = self._approach_speed
                 else:
                     self.clearance_denial_reason = reason
                     result = {"success": False, "message": f"Cannot clear to land: {reason}"}
@@ -253,137 +392,97 @@ class Flight:
         if self.speed > rules["max_speed"]:
             return False, f"Speed {int(self.speed)}kt exceeds max {rules['max_speed']}kt"
         
-        distance = math.sqrt(self.position.x**2 + self.position.y**2)
-        if distance > rules["max_distance"]:
-            return False, f"Distance {distance:.1f}nm exceeds max {rules['max_distance']}nm"
+        dist_sq = self.position.x**2 + self.position.y**2
+        if dist_sq > rules["max_distance"]**2:
+            return False, f"Distance {sqrt(dist_sq):.1f}nm exceeds max {rules['max_distance']}nm"
         
-        if rules["required_waypoint"] not in self.passed_waypoints:
+        if not self._passed_bits & _WP_BIT[rules["required_waypoint"]]:
             return False, f"Must pass {rules['required_waypoint']} waypoint first"
         
         return True, None
     
-    def update(self, dt: float) -> None:
-        """Update flight physics for dt seconds."""
-        if self.status in [FlightStatus.LANDED, FlightStatus.DEPARTED, FlightStatus.AT_GATE]:
-            if self.status == FlightStatus.AT_GATE and self.flight_type == FlightType.DEPARTURE:
-                self.gate_time += dt
-                if self.gate_time > 60:
-                    self.status = FlightStatus.READY_FOR_TAKEOFF
-            return
-        
-        # Navigate to waypoint if set
-        if self.target_waypoint:
-            self._navigate_to_waypoint()
-        
-        # Update altitude
-        if abs(self.altitude - self.target_altitude) > 10:
-            if self.altitude < self.target_altitude:
-                climb_rate = self.characteristics["climb_rate"]
-                self.altitude += climb_rate * (dt / 60)
-            else:
-                descent_rate = self.characteristics["descent_rate"]
-                self.altitude -= descent_rate * (dt / 60)
-            self.altitude = max(0, self.altitude)
-        
-        # Update speed
-        speed_change_rate = 5
-        if abs(self.speed - self.target_speed) > 1:
-            if self.speed < self.target_speed:
-                self.speed = min(self.speed + speed_change_rate * dt, self.target_speed)
-            else:
-                self.speed = max(self.speed - speed_change_rate * dt, self.target_speed)
-        
-        # Update heading
-        turn_rate = 3
-        heading_diff = (self.target_heading - self.heading + 540) % 360 - 180
-        if abs(heading_diff) > 0.5:
-            turn_amount = min(abs(heading_diff), turn_rate * dt)
-            self.heading += turn_amount if heading_diff > 0 else -turn_amount
-            self.heading = self.heading % 360
-        
-        # Update position
-        distance = (self.speed / 3600) * dt
-        heading_rad = math.radians(self.heading)
-        
-        self.position.x += distance * math.sin(heading_rad)
-        self.position.y += distance * math.cos(heading_rad)
-        
-        # Check waypoint passage
-        self._check_waypoint_passage()
-        
-        # Update status
-        self._update_status()
-    
+
+    def _set_target_waypoint(self, name: Optional[str]) -> None:
+        """Point the flight at a waypoint, caching its coordinates.
+
+        The cached (x, y) pair saves the WAYPOINTS dict lookup and two
+        attribute chains in _navigate_to_waypoint every tick.
+        """
+        self.target_waypoint = name
+        if name is None:
+            self._target_wp_pos = None
+        else:
+            wp_pos = WAYPOINTS[name].position
+            self._target_wp_pos = (wp_pos.x, wp_pos.y)
+
     def _navigate_to_waypoint(self) -> None:
         """Calculate heading to target waypoint."""
-        if not self.target_waypoint or self.target_waypoint not in WAYPOINTS:
+        target = self._target_wp_pos
+        if target is None:
             return
+        dx = target[0] - self.position.x
+        dy = target[1] - self.position.y
         
-        waypoint = WAYPOINTS[self.target_waypoint]
-        dx = waypoint.position.x - self.position.x
-        dy = waypoint.position.y - self.position.y
-        
-        bearing = math.degrees(math.atan2(dx, dy)) % 360
-        self.target_heading = bearing
+        self.target_heading = degrees(atan2(dx, dy)) % 360
     
-    def _check_waypoint_passage(self) -> None:
-        """Check if we've passed any waypoints."""
-        for name, waypoint in WAYPOINTS.items():
-            dx = waypoint.position.x - self.position.x
-            dy = waypoint.position.y - self.position.y
-            distance = math.sqrt(dx**2 + dy**2)
-            
-            if distance < 0.5:
-                # Only append if different from the last waypoint (avoid consecutive duplicates)
-                if not self.passed_waypoints or self.passed_waypoints[-1] != name:
-                    self.passed_waypoints.append(name)
-                if self.target_waypoint == name:
-                    # Continue on current heading after passing waypoint
-                    # (don't circle - just clear the waypoint target)
-                    self.target_waypoint = None
-                    # Keep the current heading as target
-                    self.target_heading = self.heading
+    def _record_waypoint_pass(self, name: str) -> None:
+        """Record passage of a waypoint the simulator found in range."""
+        self._passed_bits |= _WP_BIT[name]
+        # Only append if different from the last waypoint (avoid consecutive duplicates)
+        if not self.passed_waypoints or self.passed_waypoints[-1] != name:
+            self.passed_waypoints.append(name)
+        if self.target_waypoint == name:
+            # Continue on current heading after passing waypoint
+            # (don't circle - just clear the waypoint target)
+            self._set_target_waypoint(None)
+            # Keep the current heading as target
+            self.target_heading = self.heading
     
     def _update_status(self) -> None:
         """Update flight status based on current conditions."""
-        distance_to_airport = math.sqrt(self.position.x**2 + self.position.y**2)
+        airport_dist_sq = self.position.x**2 + self.position.y**2
         
-        if self.flight_type == FlightType.ARRIVAL:
-            if self.status == FlightStatus.APPROACHING:
-                if "FINAL" in self.passed_waypoints and self.altitude < 2000:
+        if self.flight_type is FlightType.ARRIVAL:
+            if self.status is FlightStatus.APPROACHING:
+                if self._passed_bits & _FINAL_BIT and self.altitude < 2000:
                     self.status = FlightStatus.ON_FINAL
-            elif self.status == FlightStatus.ON_FINAL:
-                if self.cleared_to_land and distance_to_airport < 0.5 and self.altitude < 300:
+            elif self.status is FlightStatus.ON_FINAL:
+                if self.cleared_to_land and airport_dist_sq < 0.25 and self.altitude < 300:
                     self.status = FlightStatus.LANDING
-            elif self.status == FlightStatus.LANDING:
-                if distance_to_airport < 0.1 or self.altitude <= AIRPORT["elevation"] + 20:
+            elif self.status is FlightStatus.LANDING:
+                if airport_dist_sq < 0.01 or self.altitude <= AIRPORT["elevation"] + 20:
                     self.altitude = AIRPORT["elevation"]
                     self.speed = 0
                     self.status = FlightStatus.LANDED
                     self.completed_at = datetime.now()
         
-        elif self.flight_type == FlightType.DEPARTURE:
-            if self.status == FlightStatus.READY_FOR_TAKEOFF:
+        elif self.flight_type is FlightType.DEPARTURE:
+            if self.status is FlightStatus.READY_FOR_TAKEOFF:
                 if self.cleared_for_takeoff:
                     self.status = FlightStatus.TAKING_OFF
                     self.target_speed = 180
                     self.target_altitude = 6000
                     self.target_heading = AIRPORT["runway_heading"]
                     # Auto-route to NORTH waypoint
-                    self.target_waypoint = "NORTH"
+                    self._set_target_waypoint("NORTH")
                     self.current_waypoint = "NORTH"
-            elif self.status == FlightStatus.TAKING_OFF:
+            elif self.status is FlightStatus.TAKING_OFF:
                 if self.speed > 140:
                     self.status = FlightStatus.DEPARTING
-            elif self.status == FlightStatus.DEPARTING:
+            elif self.status is FlightStatus.DEPARTING:
                 # Depart when reached NORTH waypoint AND 6000ft
-                if "NORTH" in self.passed_waypoints and self.altitude >= 5900:
+                if self._passed_bits & _NORTH_BIT and self.altitude >= 5900:
                     self.status = FlightStatus.DEPARTED
                     self.completed_at = datetime.now()
     
     def to_data(self) -> FlightData:
-        """Convert to FlightData model."""
-        return FlightData(
+        """Convert to FlightData model.
+
+        model_construct skips pydantic validation - every field here is
+        already the right type, and this runs for every flight on every
+        broadcast tick.
+        """
+        return FlightData.model_construct(
             callsign=self.callsign,
             flight_type=self.flight_type,
             status=self.status,
@@ -422,6 +521,9 @@ class ATCSimulator:
     def __init__(self):
         self.flights: dict[str, Flight] = {}
         self.flight_counter = 0
+        # Dedicated RNG: seedable per simulator and a bound-method call
+        # instead of the module-global indirection
+        self.rng = random.Random()
         self.running = False
         self.failed = False
         self.failure_reason: Optional[str] = None
@@ -436,14 +538,59 @@ class ATCSimulator:
         self.collision_pair: Optional[tuple[str, str]] = None
         
         # Flight history (completed flights)
-        self.landed_flights: list[dict] = []
-        self.departed_flights: list[dict] = []
+        # Bounded history: the API only ever serves the last 50 of each, so
+        # let the deque drop old entries instead of slicing a growing list
+        self.landed_flights: deque[dict] = deque(maxlen=50)
+        self.departed_flights: deque[dict] = deque(maxlen=50)
         
         self.active_near_misses: set[tuple[str, str]] = set()
-        
+
+        # Completed flights awaiting removal: callsign -> monotonic time of
+        # completion. Membership here doubles as the "already counted" flag.
+        self._completion_times: dict[str, float] = {}
+
+        # Maintained indexes so the tick loop never touches idle flights:
+        # _active_flights get physics, _gate_flights only accumulate gate
+        # time, and LANDED/DEPARTED flights sit in neither until cleanup.
+        # Kept in sync by spawn/_on_status_change/cleanup_flights.
+        self._active_flights: dict[str, Flight] = {}
+        self._gate_flights: dict[str, Flight] = {}
+        self._airborne: dict[str, Flight] = {}
+
+        # FlightData snapshots built at most once per tick: the broadcast
+        # callback, the per-flight subscriptions and any API reads landing
+        # between ticks all share the same models
+        self._flight_data_cache: dict[str, FlightData] = {}
+        self._flight_data_tick = -1
+        # Parallel cache of model_dump() results for the broadcast path,
+        # so the 10 Hz WebSocket fan-out reuses plain dicts instead of
+        # re-dumping every model every broadcast
+        self._flight_dump_cache: dict[str, dict] = {}
+        self._flight_dump_tick = -1
+        self._tick = 0
+
+        # Per-flight WebSocket subscribers: callsign -> queues of latest snapshots
+        self.flight_subscribers: dict[str, set[asyncio.Queue]] = {}
+
+        # SoA snapshot of per-flight state, rebuilt once per tick. Queries
+        # that only need positions/altitudes/types (status counts, separation
+        # checks) read these arrays instead of walking Flight objects;
+        # FlightData models are still only built lazily at the API boundary.
+        self._soa_flights: list[Flight] = []
+        self._soa_callsigns: tuple[str, ...] = ()
+        self._soa_pos = np.empty((0, 2))
+        self._soa_alt = np.empty(0)
+        self._soa_type = np.empty(0, dtype=np.int8)
+        self._soa_airborne = np.empty(0, dtype=bool)
+
         self.session_start = datetime.now()
         
         self.scores_file = Path(__file__).parent.parent / "scores.json"
+
+        # Scores history held in memory: the file is parsed once on first
+        # save and only appended to / rewritten from this cache afterwards,
+        # instead of a full read-modify-write per save
+        self._scores_cache: Optional[list] = None
     
     def reset(self) -> None:
         """Reset the simulation."""
@@ -458,6 +605,10 @@ class ATCSimulator:
         self.landed_flights.clear()
         self.departed_flights.clear()
         self.active_near_misses.clear()
+        self._completion_times.clear()
+        self._active_flights.clear()
+        self._gate_flights.clear()
+        self._airborne.clear()
         self.session_start = datetime.now()
         self.running = True
     
@@ -467,8 +618,8 @@ class ATCSimulator:
     
     def generate_callsign(self) -> str:
         """Generate a unique flight callsign."""
-        airline = random.choice(AIRLINES)
-        number = random.randint(100, 9999)
+        airline = self.rng.choice(AIRLINES)
+        number = self.rng.randint(100, 9999)
         return f"{airline}{number}"
     
     def _find_safe_spawn_position(self, min_separation_nm: float = 5.0, max_attempts: int = 20) -> Optional[tuple[float, float]]:
@@ -482,24 +633,24 @@ class ATCSimulator:
         Returns:
             Tuple of (x, y) coordinates or None if no safe position found
         """
-        airborne = [f for f in self.flights.values() if f.is_airborne_active()]
+        airborne = list(self._airborne.values())
         
         for _ in range(max_attempts):
             # Random angle around the airport (0-360 degrees)
-            angle = random.uniform(0, 2 * math.pi)
+            angle = self.rng.uniform(0, 2 * pi)
             # Random distance 25-35nm from airport
-            distance = random.uniform(25, 35)
+            distance = self.rng.uniform(25, 35)
             
-            spawn_x = distance * math.sin(angle)
-            spawn_y = distance * math.cos(angle)
+            spawn_x = distance * sin(angle)
+            spawn_y = distance * cos(angle)
             
-            # Check separation from all airborne aircraft
+            # Check separation from all airborne aircraft (squared compare)
+            min_sep_sq = min_separation_nm ** 2
             is_safe = True
             for flight in airborne:
                 dx = spawn_x - flight.position.x
                 dy = spawn_y - flight.position.y
-                sep = math.sqrt(dx**2 + dy**2)
-                if sep < min_separation_nm:
+                if dx*dx + dy*dy < min_sep_sq:
                     is_safe = False
                     break
             
@@ -522,9 +673,9 @@ class ATCSimulator:
         spawn_x, spawn_y = spawn_pos
         
         # Calculate heading directly towards the runway (0, 0)
-        heading = math.degrees(math.atan2(-spawn_x, -spawn_y)) % 360
+        heading = degrees(atan2(-spawn_x, -spawn_y)) % 360
         
-        aircraft_type = random.choice(list(AIRCRAFT_TYPES.keys()))
+        aircraft_type = self.rng.choice(_AIRCRAFT_KEYS)
         
         callsign = self.generate_callsign()
         while callsign in self.flights:
@@ -535,10 +686,10 @@ class ATCSimulator:
             flight_type=FlightType.ARRIVAL,
             aircraft_type=aircraft_type,
             position=Position(x=spawn_x, y=spawn_y),
-            altitude=random.randint(8000, 12000),
-            speed=AIRCRAFT_TYPES[aircraft_type]["cruise_speed"] * 0.7,
+            altitude=self.rng.randint(8000, 12000),
+            speed=AIRCRAFT_TYPES[aircraft_type].cruise_speed * 0.7,
             heading=heading,
-            origin=random.choice(["KSEA", "KPDX", "KBFI", "KPAE", "KOLM"]),
+            origin=self.rng.choice(_AIRPORTS),
             destination=AIRPORT["icao"],
         )
         
@@ -548,6 +699,8 @@ class ATCSimulator:
         flight.target_speed = 250
         
         self.flights[callsign] = flight
+        self._active_flights[callsign] = flight
+        self._airborne[callsign] = flight
         return flight
     
     def spawn_departure(self) -> Optional[Flight]:
@@ -555,7 +708,7 @@ class ATCSimulator:
         if self.failed:
             return None
             
-        aircraft_type = random.choice(list(AIRCRAFT_TYPES.keys()))
+        aircraft_type = self.rng.choice(_AIRCRAFT_KEYS)
         
         callsign = self.generate_callsign()
         while callsign in self.flights:
@@ -570,40 +723,57 @@ class ATCSimulator:
             speed=0,
             heading=AIRPORT["runway_heading"],
             origin=AIRPORT["icao"],
-            destination=random.choice(["KSEA", "KPDX", "KBFI", "KPAE", "KOLM"]),
+            destination=self.rng.choice(_AIRPORTS),
         )
         
         self.flights[callsign] = flight
+        self._gate_flights[callsign] = flight
         return flight
     
     def get_flight(self, callsign: str) -> Optional[Flight]:
         return self.flights.get(callsign)
     
+    def _flight_data(self) -> dict[str, FlightData]:
+        """Return the per-tick cache of FlightData models, rebuilding if stale."""
+        if self._flight_data_tick != self._tick:
+            self._flight_data_cache = {
+                callsign: f.to_data() for callsign, f in self.flights.items()
+            }
+            self._flight_data_tick = self._tick
+        return self._flight_data_cache
+
+    def _flight_dicts(self) -> dict[str, dict]:
+        """Per-tick cache of dumped flight dicts, parallel to _flight_data."""
+        if self._flight_dump_tick != self._tick:
+            self._flight_dump_cache = {
+                callsign: model.model_dump()
+                for callsign, model in self._flight_data().items()
+            }
+            self._flight_dump_tick = self._tick
+        return self._flight_dump_cache
+
     def get_all_flights(self) -> list[FlightData]:
-        return [f.to_data() for f in self.flights.values()]
+        return list(self._flight_data().values())
+
+    def get_all_flight_dicts(self) -> list[dict]:
+        """Flight snapshots as plain dicts (shared per-tick cache)."""
+        return list(self._flight_dicts().values())
     
     def get_landing_flights(self) -> list[FlightData]:
-        landing_statuses = [
-            FlightStatus.APPROACHING,
-            FlightStatus.ON_FINAL,
-            FlightStatus.LANDING,
-        ]
-        return [f.to_data() for f in self.flights.values() 
-                if f.status in landing_statuses]
+        data = self._flight_data()
+        return [data[callsign] for callsign, f in self.flights.items()
+                if f.status in LANDING_STATUSES]
     
     def get_takeoff_flights(self) -> list[FlightData]:
-        takeoff_statuses = [
-            FlightStatus.READY_FOR_TAKEOFF,
-            FlightStatus.TAKING_OFF,
-        ]
-        return [f.to_data() for f in self.flights.values()
-                if f.status in takeoff_statuses]
+        data = self._flight_data()
+        return [data[callsign] for callsign, f in self.flights.items()
+                if f.status in TAKEOFF_STATUSES]
     
     def get_flight_history(self) -> dict:
-        """Get completed flight history."""
+        """Get completed flight history (last 50 landed / departed)."""
         return {
-            "landed": self.landed_flights[-50:],  # Last 50
-            "departed": self.departed_flights[-50:],
+            "landed": list(self.landed_flights),
+            "departed": list(self.departed_flights),
         }
     
     def get_waypoints(self) -> dict[str, Waypoint]:
@@ -615,6 +785,12 @@ class ATCSimulator:
     def get_airport(self) -> dict:
         return AIRPORT
     
+    def count_flight_types(self) -> tuple[int, int]:
+        """Return (arrivals, departures) from the SoA snapshot."""
+        types = self._soa_type
+        arrivals = int(np.count_nonzero(types == 0))
+        return arrivals, types.size - arrivals
+
     def get_stats(self) -> dict:
         return {
             "landed": self.landed_count,
@@ -628,19 +804,51 @@ class ATCSimulator:
         }
     
     def get_near_misses(self) -> list[dict]:
+        flights_get = self.flights.get
         near_misses = []
         for pair in self.active_near_misses:
-            f1 = self.flights.get(pair[0])
-            f2 = self.flights.get(pair[1])
+            f1 = flights_get(pair[0])
+            f2 = flights_get(pair[1])
             if f1 and f2:
-                mid_x = (f1.position.x + f2.position.x) / 2
-                mid_y = (f1.position.y + f2.position.y) / 2
+                p1, p2 = f1.position, f2.position
                 near_misses.append({
                     "callsigns": pair,
-                    "position": {"x": mid_x, "y": mid_y}
+                    "position": {"x": (p1.x + p2.x) * 0.5,
+                                 "y": (p1.y + p2.y) * 0.5},
                 })
         return near_misses
     
+    def subscribe_flight(self, callsign: str) -> asyncio.Queue:
+        """Subscribe to per-tick snapshots for a single flight.
+
+        Returns a latest-value queue: if the consumer falls behind, the stale
+        snapshot is dropped and replaced rather than queueing unboundedly.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+        self.flight_subscribers.setdefault(callsign, set()).add(queue)
+        return queue
+
+    def unsubscribe_flight(self, callsign: str, queue: asyncio.Queue) -> None:
+        """Remove a flight subscription created by subscribe_flight."""
+        queues = self.flight_subscribers.get(callsign)
+        if queues:
+            queues.discard(queue)
+            if not queues:
+                del self.flight_subscribers[callsign]
+
+    def _publish_flight_updates(self) -> None:
+        """Push the current snapshot of each subscribed flight to its queues."""
+        dicts = self._flight_dicts()
+        for callsign, queues in list(self.flight_subscribers.items()):
+            snapshot = dicts.get(callsign)
+            if snapshot is None:
+                # Flight left the simulation (landed/departed and cleaned up)
+                snapshot = {"callsign": callsign, "removed": True}
+            for queue in queues:
+                if queue.full():
+                    queue.get_nowait()
+                queue.put_nowait(snapshot)
+
     def command_flight(self, callsign: str, command: FlightCommand) -> dict:
         if self.failed:
             return {"success": False, "message": "Simulation has failed"}
@@ -649,61 +857,159 @@ class ATCSimulator:
             return flight.apply_command(command)
         return {"success": False, "message": f"Flight {callsign} not found"}
     
+    def _check_separation_pair(self, f1: Flight, f2: Flight,
+                               current_near_misses: set[tuple[str, str]]) -> bool:
+        """Evaluate one candidate pair; returns True if it was a collision."""
+        dx = f1.position.x - f2.position.x
+        dy = f1.position.y - f2.position.y
+        horizontal_sq = dx*dx + dy*dy
+        vertical_dist = abs(f1.altitude - f2.altitude)
+
+        pair = tuple(sorted([f1.callsign, f2.callsign]))
+
+        # Collision: within ~900ft horizontal AND 500ft vertical
+        if horizontal_sq < COLLISION_R2 and vertical_dist < COLLISION_ALTITUDE:
+            self.failed = True
+            self.failure_reason = f"COLLISION: {f1.callsign} and {f2.callsign}"
+            self.collision_pair = pair
+            self.save_score()  # Auto-save on collision
+            return True
+
+        # Near miss: within ~3000ft horizontal AND 1000ft vertical
+        if horizontal_sq < NEAR_MISS_R2 and vertical_dist < NEAR_MISS_ALTITUDE:
+            current_near_misses.add(pair)
+            if pair not in self.active_near_misses:
+                self.near_miss_count += 1
+        return False
+
     def check_separations(self) -> None:
-        """Check for near misses and collisions between airborne flights."""
+        """Check for near misses and collisions between airborne flights.
+
+        Two strategies depending on traffic: for typical counts (up to
+        DENSE_SEPARATION_LIMIT) an all-pairs numpy distance matrix runs in
+        a few vectorized ops; past that, flights are hashed into a uniform
+        grid bucketed at the near-miss radius so only same/adjacent-cell
+        pairs are evaluated.
+        """
         if self.failed:
             return
-            
-        airborne = [f for f in self.flights.values() if f.is_airborne_active()]
+
+        if len(self._airborne) < 2:
+            self.active_near_misses = set()
+            return
+        # Slice the airborne rows out of the SoA snapshot built this tick,
+        # sharing the coordinate buffer with the other spatial queries
+        if self._soa_airborne.shape[0] == len(self.flights):
+            idx = np.nonzero(self._soa_airborne)[0]
+            airborne = [self._soa_flights[i] for i in idx]
+            x = self._soa_pos[idx, 0]
+            y = self._soa_pos[idx, 1]
+            alt = self._soa_alt[idx]
+        else:
+            # SoA snapshot stale (direct call outside the tick loop)
+            airborne = list(self._airborne.values())
+            n = len(airborne)
+            x = np.fromiter((f.position.x for f in airborne), dtype=float, count=n)
+            y = np.fromiter((f.position.y for f in airborne), dtype=float, count=n)
+            alt = np.fromiter((f.altitude for f in airborne), dtype=float, count=n)
+
+        if len(airborne) <= DENSE_SEPARATION_LIMIT:
+            self._check_separations_dense(airborne, x, y, alt)
+        else:
+            self._check_separations_grid(airborne)
+
+    def _check_separations_dense(self, airborne: list[Flight], x, y, alt) -> None:
+        """All-pairs separation check on upper-triangle distance matrices."""
+        n = len(airborne)
+        dx = x[:, None] - x
+        dy = y[:, None] - y
+        d2 = dx * dx + dy * dy
+        dz = np.abs(alt[:, None] - alt)
+        upper = np.triu(np.ones((n, n), dtype=bool), 1)
+
+        collisions = (d2 < COLLISION_R2) & (dz < COLLISION_ALTITUDE) & upper
+        ci, cj = np.nonzero(collisions)
+        if ci.size:
+            f1, f2 = airborne[ci[0]], airborne[cj[0]]
+            pair = tuple(sorted([f1.callsign, f2.callsign]))
+            self.failed = True
+            self.failure_reason = f"COLLISION: {f1.callsign} and {f2.callsign}"
+            self.collision_pair = pair
+            self.save_score()  # Auto-save on collision
+            return
+
         current_near_misses: set[tuple[str, str]] = set()
-        
-        for i, f1 in enumerate(airborne):
-            for f2 in airborne[i+1:]:
-                dx = f1.position.x - f2.position.x
-                dy = f1.position.y - f2.position.y
-                horizontal_dist = math.sqrt(dx**2 + dy**2)
-                vertical_dist = abs(f1.altitude - f2.altitude)
-                
-                pair = tuple(sorted([f1.callsign, f2.callsign]))
-                
-                # Collision: within ~900ft horizontal AND 500ft vertical
-                if horizontal_dist < COLLISION_DISTANCE_NM and vertical_dist < COLLISION_ALTITUDE:
-                    self.failed = True
-                    self.failure_reason = f"COLLISION: {f1.callsign} and {f2.callsign}"
-                    self.collision_pair = pair
-                    self.save_score()  # Auto-save on collision
-                    return
-                
-                # Near miss: within ~3000ft horizontal AND 1000ft vertical
-                if horizontal_dist < NEAR_MISS_DISTANCE_NM and vertical_dist < NEAR_MISS_ALTITUDE:
-                    current_near_misses.add(pair)
-                    if pair not in self.active_near_misses:
-                        self.near_miss_count += 1
-        
+        near = (d2 < NEAR_MISS_R2) & (dz < NEAR_MISS_ALTITUDE) & upper
+        for i, j in zip(*np.nonzero(near)):
+            pair = tuple(sorted([airborne[i].callsign, airborne[j].callsign]))
+            current_near_misses.add(pair)
+            if pair not in self.active_near_misses:
+                self.near_miss_count += 1
+        self.active_near_misses = current_near_misses
+
+    def _check_separations_grid(self, airborne: list[Flight]) -> None:
+        """Grid-pruned separation check for dense traffic."""
+        current_near_misses: set[tuple[str, str]] = set()
+        cell = NEAR_MISS_DISTANCE_NM
+        grid: dict[tuple[int, int], list[Flight]] = {}
+        for f in airborne:
+            key = (int(f.position.x // cell), int(f.position.y // cell))
+            grid.setdefault(key, []).append(f)
+
+        for (cx, cy), bucket in grid.items():
+            for i, f1 in enumerate(bucket):
+                for f2 in bucket[i + 1:]:
+                    if self._check_separation_pair(f1, f2, current_near_misses):
+                        return
+            # Forward half of the 8-neighborhood, so each cell pair is
+            # visited exactly once
+            for neighbor_key in ((cx + 1, cy - 1), (cx + 1, cy),
+                                 (cx + 1, cy + 1), (cx, cy + 1)):
+                other = grid.get(neighbor_key)
+                if other:
+                    for f1 in bucket:
+                        for f2 in other:
+                            if self._check_separation_pair(f1, f2, current_near_misses):
+                                return
+
         self.active_near_misses = current_near_misses
     
-    def cleanup_flights(self) -> None:
+    def cleanup_flights(self, now: Optional[float] = None) -> None:
+        """Count and expire completed flights; `now` is monotonic seconds.
+
+        The caller passes one timestamp for the whole tick, and the
+        already-counted check is a dict lookup keyed by callsign instead of
+        probing per-flight attributes with hasattr.
+        """
+        if now is None:
+            now = time.monotonic()
+        times = self._completion_times
         to_remove = []
         for callsign, flight in self.flights.items():
-            if flight.status == FlightStatus.LANDED:
-                if not hasattr(flight, '_counted'):
+            status = flight.status
+            if status is FlightStatus.LANDED:
+                completed = times.get(callsign)
+                if completed is None:
                     self.landed_count += 1
                     self.landed_flights.append(flight.to_history_data())
-                    flight._counted = True
-                    flight._landed_time = datetime.now()
-                elif (datetime.now() - flight._landed_time).total_seconds() > 3:
+                    times[callsign] = now
+                elif now - completed > 3.0:
                     to_remove.append(callsign)
-            elif flight.status == FlightStatus.DEPARTED:
-                if not hasattr(flight, '_counted'):
+            elif status is FlightStatus.DEPARTED:
+                completed = times.get(callsign)
+                if completed is None:
                     self.departed_count += 1
                     self.departed_flights.append(flight.to_history_data())
-                    flight._counted = True
-                    flight._departed_time = datetime.now()
-                elif (datetime.now() - flight._departed_time).total_seconds() > 3:
+                    times[callsign] = now
+                elif now - completed > 3.0:
                     to_remove.append(callsign)
         
         for callsign in to_remove:
             del self.flights[callsign]
+            del times[callsign]
+            self._active_flights.pop(callsign, None)
+            self._gate_flights.pop(callsign, None)
+            self._airborne.pop(callsign, None)
     
     def save_score(self) -> dict:
         """Save the current score to file."""
@@ -717,54 +1023,180 @@ class ATCSimulator:
             "duration_seconds": (datetime.now() - self.session_start).total_seconds(),
         }
         
-        scores = []
-        if self.scores_file.exists():
-            try:
-                with open(self.scores_file, 'r') as f:
-                    scores = json.load(f)
-            except:
-                scores = []
+        if self._scores_cache is None:
+            scores = []
+            if self.scores_file.exists():
+                try:
+                    with open(self.scores_file, 'r') as f:
+                        scores = json.load(f)
+                except:
+                    scores = []
+            self._scores_cache = scores[-100:]
         
-        scores.append(score)
-        scores = scores[-100:]
+        self._scores_cache.append(score)
+        del self._scores_cache[:-100]
         
         with open(self.scores_file, 'w') as f:
-            json.dump(scores, f, indent=2)
+            json.dump(self._scores_cache, f, indent=2)
         
         return score
     
+    def _rebuild_soa(self) -> None:
+        """Refresh the SoA state arrays from the flight objects.
+
+        One pass fills position/altitude/type plus the airborne mask, and
+        the same buffers then feed both the status counting and the
+        separation query - no second gather per workload.
+        """
+        flights = list(self.flights.values())
+        n = len(flights)
+        pos = np.empty((n, 2))
+        alt = np.empty(n)
+        types = np.empty(n, dtype=np.int8)
+        airborne_mask = np.empty(n, dtype=bool)
+        airborne = self._airborne
+        for i, f in enumerate(flights):
+            pos[i, 0] = f.position.x
+            pos[i, 1] = f.position.y
+            alt[i] = f.altitude
+            types[i] = TYPE_CODES[f.flight_type]
+            airborne_mask[i] = f.callsign in airborne
+        self._soa_flights = flights
+        self._soa_callsigns = tuple(f.callsign for f in flights)
+        self._soa_pos = pos
+        self._soa_alt = alt
+        self._soa_type = types
+        self._soa_airborne = airborne_mask
+
+    def _step_physics(self, flights: list[Flight], dt: float) -> tuple:
+        """Run the kinematics kernel over the given flights (SoA round trip).
+
+        Returns the updated (x, y) arrays so callers can reuse them for the
+        broadcasted waypoint-passage check.
+        """
+        n = len(flights)
+        x = np.fromiter((f.position.x for f in flights), dtype=float, count=n)
+        y = np.fromiter((f.position.y for f in flights), dtype=float, count=n)
+        alt = np.fromiter((f.altitude for f in flights), dtype=float, count=n)
+        spd = np.fromiter((f.speed for f in flights), dtype=float, count=n)
+        hdg = np.fromiter((f.heading for f in flights), dtype=float, count=n)
+        tgt_alt = np.fromiter((f.target_altitude for f in flights), dtype=float, count=n)
+        tgt_spd = np.fromiter((f.target_speed for f in flights), dtype=float, count=n)
+        tgt_hdg = np.fromiter((f.target_heading for f in flights), dtype=float, count=n)
+        climb = np.fromiter((f._climb_rate for f in flights), dtype=float, count=n)
+        descent = np.fromiter((f._descent_rate for f in flights), dtype=float, count=n)
+
+        _kinematics_kernel(x, y, alt, spd, hdg, tgt_alt, tgt_spd, tgt_hdg,
+                           climb, descent, dt)
+
+        # float() on writeback keeps the model layer on plain Python
+        # floats - numpy scalars would leak into every serialization path
+        for i, f in enumerate(flights):
+            f.position.x = float(x[i])
+            f.position.y = float(y[i])
+            f.altitude = float(alt[i])
+            f.speed = float(spd[i])
+            f.heading = float(hdg[i])
+
+        return x, y
+
+    def _on_status_change(self, flight: Flight) -> None:
+        """Keep the maintained flight indexes in sync after a transition."""
+        status = flight.status
+        if status in AIRBORNE_STATUSES:
+            self._airborne[flight.callsign] = flight
+        else:
+            self._airborne.pop(flight.callsign, None)
+        if status is FlightStatus.LANDED or status is FlightStatus.DEPARTED:
+            self._active_flights.pop(flight.callsign, None)
+
     def update(self, dt: float) -> None:
+        # Tick advances even when the simulation has failed: run() gates
+        # broadcasting on the tick counter, and clients still need to be
+        # told about the collision/failed state
+        self._tick += 1
         if self.failed:
             return
-            
+
         dt *= self.speed_multiplier
-        
-        for flight in self.flights.values():
-            flight.update(dt)
-        
+
+        # Gate-hold departures: just the timer, no physics or status scan
+        if self._gate_flights:
+            for callsign, flight in list(self._gate_flights.items()):
+                flight.gate_time += dt
+                if flight.gate_time > 60:
+                    flight.status = FlightStatus.READY_FOR_TAKEOFF
+                    del self._gate_flights[callsign]
+                    self._active_flights[callsign] = flight
+
+        # Only flights that actually fly reach the kinematics kernel;
+        # LANDED/DEPARTED flights wait for cleanup without costing a call
+        active = list(self._active_flights.values())
+        for flight in active:
+            if flight.target_waypoint:
+                flight._navigate_to_waypoint()
+
+        if active:
+            x, y = self._step_physics(active, dt)
+            # One broadcasted (flights x waypoints) distance check; hits are
+            # sparse, so the Python work is per passage, not per pair
+            d2 = (x[:, None] - _WP_X) ** 2 + (y[:, None] - _WP_Y) ** 2
+            for i, w in zip(*np.nonzero(d2 < WAYPOINT_PASS_R2)):
+                active[i]._record_waypoint_pass(_WP_NAMES[w])
+            for flight in active:
+                status_before = flight.status
+                flight._update_status()
+                if flight.status is not status_before:
+                    self._on_status_change(flight)
+
+        self._rebuild_soa()
         self.check_separations()
-        self.cleanup_flights()
+        self.cleanup_flights(time.monotonic())
     
     async def run(self) -> None:
         self.running = True
-        last_update = datetime.now()
+        # Monotonic float clock: immune to wall-clock jumps and much cheaper
+        # than building datetime objects twice per tick
+        last_update = time.monotonic()
+        next_tick = last_update
         
         while self.running:
-            now = datetime.now()
-            dt = (now - last_update).total_seconds()
+            now = time.monotonic()
+            dt = now - last_update
             last_update = now
             
             self.update(dt)
+
+            # Broadcasting (JSON serialization, WebSocket sends) is the
+            # expensive half of the loop - keep it at the old 10 Hz while
+            # physics integrates 5x more finely
+            if self._tick % BROADCAST_EVERY == 0:
+                if self.flight_subscribers:
+                    self._publish_flight_updates()
+
+                if self.update_callbacks:
+                    # Build the snapshots once and fan the callbacks out
+                    # concurrently - one slow subscriber no longer serializes
+                    # the rest, and return_exceptions keeps a failing
+                    # callback from killing the tick loop
+                    flights = self.get_all_flight_dicts()
+                    stats = self.get_stats()
+                    near_misses = self.get_near_misses()
+                    history = self.get_flight_history()
+                    await asyncio.gather(
+                        *(callback(flights, stats, near_misses, history)
+                          for callback in self.update_callbacks),
+                        return_exceptions=True,
+                    )
             
-            for callback in self.update_callbacks:
-                await callback(
-                    self.get_all_flights(), 
-                    self.get_stats(), 
-                    self.get_near_misses(),
-                    self.get_flight_history()
-                )
-            
-            await asyncio.sleep(0.1)
+            # Sleep until the next deadline rather than a fixed interval, so
+            # tick cost doesn't stretch the effective rate. If we fall more
+            # than a tick behind, snap forward instead of racing to catch up.
+            next_tick += PHYSICS_INTERVAL
+            now = time.monotonic()
+            if next_tick < now - PHYSICS_INTERVAL:
+                next_tick = now
+            await asyncio.sleep(max(0.0, next_tick - now))
     
     def stop(self) -> None:
         self.running = False